@@ -256,6 +256,11 @@ def chains(
         "--with-geo",
         help="Enable geolocation lookups (disabled by default for faster startup).",
     ),
+    no_ui: bool = typer.Option(
+        False,
+        "--no-ui",
+        help="Stream the command's output directly instead of the interactive dashboard.",
+    ),
 ):
     """
     Starts bridges and executes a command through them using proxychains.
@@ -290,6 +295,7 @@ def chains(
                 amounts=amounts,
                 country=country,
                 skip_geo=not with_geo,  # Inverted: skip unless --with-geo
+                live_ui=not no_ui,
             )
             raise typer.Exit(code=exit_code)
 
@@ -304,7 +310,17 @@ def chains(
             console.print(f"[dim]{traceback.format_exc()}[/dim]")
             raise typer.Exit(code=1)
 
-    asyncio.run(main())
+    # The dashboard is dominated by subprocess pipe reads, where uvloop shines.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        if hasattr(uvloop, "run"):
+            uvloop.run(main())
+        else:  # uvloop < 0.18
+            uvloop.install()
+            asyncio.run(main())
 
 
 @app.command(help="Clears the proxy cache.")
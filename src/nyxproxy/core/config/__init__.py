@@ -22,6 +22,8 @@ from .settings import (
     DEFAULT_TEST_URL,
     DEFAULT_USER_AGENT,
     PROXYCHAINS_CONF_TEMPLATE,
+    PROXYCHAINS_CONF_HEAD,
+    PROXYCHAINS_CONF_TAIL,
 )
 
 __all__ = [
@@ -39,4 +41,6 @@ __all__ = [
     "DEFAULT_TEST_URL",
     "DEFAULT_USER_AGENT",
     "PROXYCHAINS_CONF_TEMPLATE",
+    "PROXYCHAINS_CONF_HEAD",
+    "PROXYCHAINS_CONF_TAIL",
 ]
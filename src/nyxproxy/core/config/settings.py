@@ -173,3 +173,12 @@ DEFAULT_USER_AGENT: str = _config["DEFAULT_USER_AGENT"]
 
 # Settings loaded from user config files
 PROXYCHAINS_CONF_TEMPLATE: str = _load_proxychains_template()
+
+# Template halves around the {proxy_list} placeholder, split (and stripped at the
+# outer ends) once so the config can be assembled by plain concatenation.
+PROXYCHAINS_CONF_HEAD, _, PROXYCHAINS_CONF_TAIL = (
+    part.replace("{{", "{").replace("}}", "}")
+    for part in PROXYCHAINS_CONF_TEMPLATE.partition("{proxy_list}")
+)
+PROXYCHAINS_CONF_HEAD = PROXYCHAINS_CONF_HEAD.lstrip()
+PROXYCHAINS_CONF_TAIL = PROXYCHAINS_CONF_TAIL.rstrip()
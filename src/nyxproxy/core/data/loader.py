@@ -2,19 +2,53 @@ from __future__ import annotations
 
 """Loading of proxies from external sources."""
 
-from typing import Iterable
+import asyncio
+from functools import partial
+from multiprocessing import Pool, cpu_count
+from typing import Callable, Iterable, List, Tuple, Union
 
 import httpx
 
 from ..config.exceptions import ProxyParsingError
+from ..models.proxy import Outbound
+
+
+def _parse_uri_worker(manager_cls: type, line: str) -> Union[Outbound, Exception]:
+    """Pool worker: the parsed outbound, or the exception parsing raised."""
+    try:
+        # The composed manager class, since the parsers use the utility mixin's helpers.
+        return manager_cls._parse_uri_cached(line)
+    except Exception as exc:
+        return exc
 
 
 class LoadingMixin:
     """Operations responsible for adding proxies to the manager."""
 
+    _SOURCE_CONCURRENCY = 16  # Sources downloaded/read at the same time
+    # Below this many lines, process startup and pickling cost more than parsing.
+    _PARSE_POOL_MIN = 20_000
+
     def add_proxies(self, proxies: Iterable[str]) -> int:
         """Adds proxies from URIs, returning the number added."""
         added_count = 0
+        # Bound once: this loop runs for every line of every source.
+        parse = self._parse_uri_cached  # Lines are stripped below already
+        register = self._register_new_outbound
+        outbounds = self._outbounds
+        errors_append = self._parse_errors.append
+        limit = self.max_count
+        # Known lines are skipped below, so each registration adds exactly one key.
+        count = len(outbounds)
+        # With a limit most lines are never reached, so parsing them all up front
+        # in the pool would be wasted work.
+        if (
+            not limit
+            and isinstance(proxies, list)
+            and len(proxies) >= self._PARSE_POOL_MIN
+            and cpu_count() > 1
+        ):
+            proxies, parse = self._parse_in_pool(proxies)
         for raw_uri in proxies:
             if not raw_uri:
                 continue
@@ -22,41 +56,94 @@ class LoadingMixin:
             line = raw_uri.strip()
             if not line or line.startswith(("#", "//")):
                 continue
+            if line in outbounds:
+                # Already loaded (e.g. listed by several sources, or a source re-read
+                # on rotation): re-registering would only add a duplicate entry.
+                continue
 
             try:
-                outbound = self._parse_uri_to_outbound(line)
-                self._register_new_outbound(line, outbound)
+                outbound = parse(line)
+                register(line, outbound)
                 added_count += 1
-                if self.max_count and len(self._outbounds) >= self.max_count:
+                count += 1
+                if limit and count >= limit:
                     if self.console:
-                        self.console.print(f"[yellow]Limit of {self.max_count} proxies reached.[/yellow]")
+                        self.console.print(f"[yellow]Limit of {limit} proxies reached.[/yellow]")
                     break
             except ProxyParsingError as exc:
-                self._parse_errors.append(f"Line ignored: {line[:80]} -> {exc}")
+                errors_append(f"Line ignored: {line[:80]} -> {exc}")
 
         return added_count
 
+    def _parse_in_pool(
+        self, proxies: List[str]
+    ) -> Tuple[List[str], Callable[[str], Outbound]]:
+        """Parses new lines across processes, returning them with a lookup of the results.
+
+        The lookup raises whatever parsing raised, so add_proxies registers the
+        results in order, with the same limit and error handling as in-process.
+        """
+        outbounds = self._outbounds
+        lines = [
+            line for line in map(str.strip, filter(None, proxies))
+            if line and not line.startswith(("#", "//")) and line not in outbounds
+        ]
+        unique_lines = list(dict.fromkeys(lines))
+        with Pool(cpu_count()) as pool:
+            worker = partial(_parse_uri_worker, type(self))
+            results = dict(zip(unique_lines, pool.imap(worker, unique_lines, chunksize=500)))
+
+        def parse(line: str) -> Outbound:
+            result = results[line]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return lines, parse
+
     async def add_sources(self, sources: Iterable[str]) -> int:
-        """Loads proxies from local files or URLs, returning the total added."""
-        total_added = 0
-        for src in sources:
-            if not src:
-                continue
-            try:
-                text = await self._read_source_text(src)
-                lines = text.splitlines()
-                total_added += self.add_proxies(lines)
+        """Loads proxies from local files or URLs, returning the total added.
+
+        Sources are read concurrently and each batch of lines is parsed as it
+        arrives, so proxies from different sources may interleave.
+        """
+        sources = [src for src in sources if src]
+        if len(sources) == 1:
+            # The usual CLI case: no tasks or semaphore for a single source.
+            return await self._add_source(sources[0])
+
+        semaphore = asyncio.Semaphore(self._SOURCE_CONCURRENCY)
+
+        async def _bounded(src: str) -> int:
+            async with semaphore:
+                return await self._add_source(src)
+
+        added_counts = await asyncio.gather(*(_bounded(src) for src in sources))
+        return sum(added_counts)
+
+    async def _add_source(self, src: str) -> int:
+        """Loads a single source, reporting its errors instead of raising them."""
+        added_count = 0
+        batches = self._iter_source_lines(src)
+        try:
+            # Each read chunk is parsed as it arrives, so a source is never held whole.
+            async for lines in batches:
+                # Checked before parsing, since other sources fill the same limit.
                 if self.max_count and len(self._outbounds) >= self.max_count:
                     break
-            except FileNotFoundError:
-                if self.console:
-                    self.console.print(f"[bold red]Error:[/bold red] File not found: '{src}'")
-            except httpx.RequestError as e:
-                if self.console:
-                    error_reason = str(e).split('\n', 1)[0]
-                    self.console.print(f"[bold red]Error:[/bold red] Failed to download from '{src}': {error_reason}")
-            except Exception as e:
-                if self.console:
-                    self.console.print(f"[bold red]Error:[/bold red] Failed to process source '{src}': {e}")
-
-        return total_added
\ No newline at end of file
+                added_count += self.add_proxies(lines)
+        except FileNotFoundError:
+            if self.console:
+                self.console.print(f"[bold red]Error:[/bold red] File not found: '{src}'")
+        except httpx.RequestError as e:
+            if self.console:
+                error_reason = str(e).split('\n', 1)[0]
+                self.console.print(f"[bold red]Error:[/bold red] Failed to download from '{src}': {error_reason}")
+        except Exception as e:
+            if self.console:
+                self.console.print(f"[bold red]Error:[/bold red] Failed to process source '{src}': {e}")
+        finally:
+            # Closes the file or HTTP stream when the limit stops reading early.
+            await batches.aclose()
+
+        return added_count
@@ -4,39 +4,155 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Dict, List
-from urllib.parse import parse_qs, unquote, urlparse
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import ParseResult, unquote, unquote_plus, urlparse
+
+try:
+    import orjson
+except ImportError:  # optional "speed" extra
+    orjson = None
 
 from ..config.exceptions import ProxyParsingError
 from ..models.proxy import Outbound
 
+# Decoded `ss://` body: method:password@host:port
+_SS_DECODED_RE = re.compile(
+    r"^(?P<method>.+?):(?P<password>.+?)@(?P<host>.+?):(?P<port>\d+)$"
+)
+
+# Supported `security` values -> their streamSettings key, as constants
+# rather than an f-string built per outbound.
+_SECURITY_SETTINGS_KEYS = {"tls": "tlsSettings", "reality": "realitySettings"}
+
+# Parameters read by ParsingMixin._build_stream_settings.
+_STREAM_PARAM_KEYS = (
+    "type", "security", "sni", "host", "path", "serviceName",
+    "alpn", "fp", "allowInsecure", "pbk", "sid", "spx",
+)
+
+
+def _split_uri(uri: str) -> Optional[Tuple[str, str, str, str]]:
+    """
+    Splits `scheme://netloc/path?query#fragment` into (netloc, path, query, fragment).
+
+    Gives the same parts as urlsplit for the URIs seen in practice, without its
+    regex work and named tuple. Returns None for inputs urlsplit would first
+    sanitize (tabs/newlines, non-ASCII netloc), so callers fall back to it.
+    """
+    if "\t" in uri or "\r" in uri or "\n" in uri:
+        return None
+    rest = uri.partition("://")[2]
+    end = len(rest)
+    for delimiter in "/?#":
+        index = rest.find(delimiter, 0, end)
+        if index != -1:
+            end = index
+    netloc = rest[:end]
+    if not netloc.isascii():
+        return None
+    rest, _, fragment = rest[end:].partition("#")
+    path, _, query = rest.partition("?")
+    return netloc, path, query, fragment
+
+
+def _split_netloc(netloc: str) -> Optional[Tuple[str, Optional[str], int]]:
+    """
+    Returns (username, hostname, port) for a plain `user@host:port` netloc.
+
+    Matches ParseResult.username/hostname/port; anything else (IPv6 literals,
+    zone ids, missing or invalid ports) returns None to take the urlparse path.
+    """
+    userinfo, at, hostinfo = netloc.rpartition("@")
+    if not at or "[" in hostinfo or "]" in hostinfo or "%" in hostinfo:
+        return None
+    host, _, port_str = hostinfo.partition(":")
+    if not (port_str.isdigit() and port_str.isascii()):
+        return None
+    port = int(port_str)
+    if port > 65535:
+        return None
+    return userinfo.partition(":")[0], host.lower() or None, port
+
+
+@lru_cache(maxsize=4096)
+def _parse_query(query: str) -> Dict[str, str]:
+    """
+    Single-value parse_qs, memoized by raw query string; URIs exported from the
+    same node repeat the same parameters. The result is shared: do not mutate it.
+
+    As with parse_qs, blank values are dropped and names/values are unquoted
+    with '+' as space. The first occurrence of a name wins, except for `alpn`,
+    whose repeated values are joined with ',' since together they form one list.
+    """
+    params: Dict[str, str] = {}
+    for pair in query.split("&"):
+        name, separator, value = pair.partition("=")
+        if not separator or not value:
+            continue
+        name = unquote_plus(name)
+        value = unquote_plus(value)
+        if name not in params:
+            params[name] = value
+        elif name == "alpn":
+            params[name] += "," + value
+    return params
+
+
+@lru_cache(maxsize=4096)
+def _stream_settings_for_query(query: str, host: str) -> Dict[str, Any]:
+    """
+    streamSettings for a vless/trojan query, memoized like `_parse_query`.
+
+    Outbounds built from the same query and host share the returned dict;
+    outbound configs are only ever serialized, never mutated in place.
+    """
+    return ParsingMixin._build_stream_settings(_parse_query(query), host)
+
 
 class ParsingMixin:
     """Responsible for interpreting different proxy schemes."""
 
     def _parse_uri_to_outbound(self, uri: str) -> Outbound:
-        """Directs the link to the appropriate parser according to the scheme."""
-        uri = uri.strip()
+        """Directs the link to the appropriate parser according to the scheme.
+
+        Results are memoized per URI, since sources are re-read on rotation and
+        after deduplication; the returned Outbound is shared, so it is read-only.
+        """
+        return self._parse_uri_cached(uri.strip())
+
+    @classmethod
+    @lru_cache(maxsize=65536)
+    def _parse_uri_cached(cls, uri: str) -> Outbound:
+        """Parses a stripped URI; failures raise and are therefore never cached."""
         if not uri or uri.startswith(("#", "//")):
             raise ProxyParsingError("Empty line or comment.")
 
-        match = re.match(r"^([a-z0-9]+)://", uri, re.I)
-        if not match:
-            raise ProxyParsingError(f"Unknown scheme in URI: {uri[:80]}")
-
-        scheme = match.group(1).lower()
-        parser = getattr(self, f"_parse_{scheme}", None)
+        scheme, sep, _ = uri.partition("://")
+        # Links almost always carry a lowercase scheme: try it as-is before validating.
+        parser = cls._SCHEME_DISPATCH.get(scheme) if sep else None
         if parser is None:
-            raise ProxyParsingError(f"Unsupported scheme: {scheme}")
+            if not sep or not scheme.isalnum() or not scheme.isascii():
+                raise ProxyParsingError(f"Unknown scheme in URI: {uri[:80]}")
+
+            scheme = scheme.lower()
+            parser = cls._SCHEME_DISPATCH.get(scheme)
+            if parser is None:
+                raise ProxyParsingError(f"Unsupported scheme: {scheme}")
 
-        return parser(uri)
+        # The scheme parsers only use class-level helpers, so cls stands in for self.
+        return parser(cls, uri)
 
     def _parse_ss(self, uri: str) -> Outbound:
         """Normalizes an `ss://` link to a Shadowsocks outbound."""
-        parsed = urlparse(uri)
-        tag = self._sanitize_tag(unquote(parsed.fragment) if parsed.fragment else None, "ss")
-
-        encoded_part = parsed.netloc + parsed.path
+        parts = _split_uri(uri)
+        if parts is None:
+            parsed = urlparse(uri)
+            parts = parsed.netloc, parsed.path, parsed.query, parsed.fragment
+        netloc, path, _, fragment = parts
+        tag = self._sanitize_tag(unquote(fragment) if fragment else None, "ss")
+
+        encoded_part = netloc + path
         if not encoded_part:
             raise ProxyParsingError("ss:// link is empty or malformed.")
 
@@ -45,7 +161,7 @@ class ParsingMixin:
         except Exception as exc:
             raise ProxyParsingError(f"Failed to decode base64 from ss://: {exc}") from exc
 
-        match = re.match(r"^(?P<method>.+?):(?P<password>.+?)@(?P<host>.+?):(?P<port>\d+)$", decoded_text)
+        match = _SS_DECODED_RE.match(decoded_text)
         if not match:
             raise ProxyParsingError("Invalid decoded ss:// format.")
 
@@ -74,13 +190,26 @@ class ParsingMixin:
         payload = uri.strip()[8:]
         try:
             decoded = self._b64decode_padded(payload)
-            data = json.loads(self._decode_bytes(decoded))
+            data = self._loads_json_payload(decoded)
         except Exception as exc:
             raise ProxyParsingError(f"Invalid vmess:// payload: {exc}") from exc
 
         return self._vmess_outbound_from_dict(data)
 
-    def _vmess_outbound_from_dict(self, data: Dict[str, Any], *, tag_fallback: str = "vmess") -> Outbound:
+    @classmethod
+    def _loads_json_payload(cls, decoded: bytes) -> Any:
+        """Parses a decoded JSON payload, straight from bytes when orjson is available."""
+        if orjson is not None:
+            try:
+                return orjson.loads(decoded)
+            except orjson.JSONDecodeError:
+                # Non-UTF-8 text, NaN, huge integers...: the stdlib path keeps the
+                # encoding fallback and its error messages.
+                pass
+        return json.loads(cls._decode_bytes(decoded))
+
+    @classmethod
+    def _vmess_outbound_from_dict(cls, data: Dict[str, Any], *, tag_fallback: str = "vmess") -> Outbound:
         """Builds the vmess outbound from the decoded dictionary."""
         if not isinstance(data, dict):
             raise ProxyParsingError("Vmess data must be a dictionary.")
@@ -91,13 +220,13 @@ class ParsingMixin:
         if not all((host, port_raw, uuid)):
             raise ProxyParsingError("Incomplete vmess data (add, port, or id missing).")
 
-        port = self._safe_int(port_raw)
+        port = cls._safe_int(port_raw)
         if port is None:
             raise ProxyParsingError(f"Invalid vmess port: {port_raw!r}")
 
-        tag = self._sanitize_tag(data.get("ps"), tag_fallback)
-        params = {k: [str(v)] for k, v in data.items()}
-        stream_settings = self._build_stream_settings(params, host)
+        tag = cls._sanitize_tag(data.get("ps"), tag_fallback)
+        params = {k: str(data[k]) for k in _STREAM_PARAM_KEYS if k in data}
+        stream_settings = cls._build_stream_settings(params, host)
 
         config = {
             "tag": tag,
@@ -120,36 +249,14 @@ class ParsingMixin:
 
     def _parse_vless(self, uri: str) -> Outbound:
         """Normalizes `vless://` links with RealITY support to a VLESS outbound."""
-        parsed = urlparse(uri)
-        uuid = parsed.username
-        host = parsed.hostname
-        port = None
-        try:
-            port = parsed.port
-        except ValueError as e:
-            if 'Port could not be cast' in str(e):
-                # Likely unbracketed IPv6 address
-                authority = parsed.netloc
-                if '@' in authority:
-                    user, authority = authority.rsplit('@', 1)
-                    uuid = unquote(user)  # In case
-                if ':' in authority:
-                    host, port_str = authority.rsplit(':', 1)
-                    try:
-                        port = int(port_str)
-                    except ValueError:
-                        raise ProxyParsingError(f"Invalid port '{port_str}' after manual parse.") from e
-                else:
-                    raise ProxyParsingError("No port found in vless URI.") from e
-            else:
-                raise ProxyParsingError("Error parsing vless port.") from e
+        uuid, host, port, query, fragment = self._split_proxy_uri(uri, "vless")
 
         if not all((uuid, host, port)):
             raise ProxyParsingError("Incomplete vless:// link (user, host, or port missing).")
 
-        params = parse_qs(parsed.query)
-        tag = self._sanitize_tag(unquote(parsed.fragment) if parsed.fragment else None, "vless")
-        stream_settings = self._build_stream_settings(params, host)
+        params = _parse_query(query)
+        tag = self._sanitize_tag(unquote(fragment) if fragment else None, "vless")
+        stream_settings = _stream_settings_for_query(query, host)
 
         config = {
             "tag": tag,
@@ -160,8 +267,8 @@ class ParsingMixin:
                     "port": port,
                     "users": [{
                         "id": uuid,
-                        "encryption": params.get("encryption", ["none"])[0],
-                        "flow": params.get("flow", [""])[0],
+                        "encryption": params.get("encryption", "none"),
+                        "flow": params.get("flow", ""),
                     }]
                 }]
             },
@@ -171,8 +278,49 @@ class ParsingMixin:
 
     def _parse_trojan(self, uri: str) -> Outbound:
         """Converts `trojan://` links with WebSocket support to a Trojan outbound."""
+        password, host, port, query, fragment = self._split_proxy_uri(uri, "trojan")
+
+        if not all((password, host, port)):
+            raise ProxyParsingError("Incomplete trojan:// link (password, host, or port missing).")
+
+        params = _parse_query(query)
+        tag = self._sanitize_tag(unquote(fragment) if fragment else None, "trojan")
+        stream_settings = _stream_settings_for_query(query, host)
+
+        config = {
+            "tag": tag,
+            "protocol": "trojan",
+            "settings": {
+                "servers": [{
+                    "address": host,
+                    "port": port,
+                    "password": password,
+                    "flow": params.get("flow", ""),
+                }]
+            },
+            "streamSettings": stream_settings
+        }
+        return Outbound(tag=tag, config=config, protocol="trojan", host=host, port=port)
+
+    @classmethod
+    def _split_proxy_uri(
+        cls, uri: str, scheme: str
+    ) -> Tuple[Optional[str], Optional[str], Optional[int], str, str]:
+        """Returns (user, host, port, query, fragment) of a `user@host:port` URI."""
+        parts = _split_uri(uri)
+        authority = _split_netloc(parts[0]) if parts is not None else None
+        if authority is not None:
+            return (*authority, parts[2], parts[3])
+
         parsed = urlparse(uri)
-        password = parsed.username
+        return (*cls._urlparse_authority(parsed, scheme), parsed.query, parsed.fragment)
+
+    @staticmethod
+    def _urlparse_authority(
+        parsed: ParseResult, scheme: str
+    ) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+        """Reads user, host and port via urlparse, tolerating unbracketed IPv6 hosts."""
+        user = parsed.username
         host = parsed.hostname
         port = None
         try:
@@ -183,7 +331,7 @@ class ParsingMixin:
                 authority = parsed.netloc
                 if '@' in authority:
                     user, authority = authority.rsplit('@', 1)
-                    password = unquote(user)
+                    user = unquote(user)
                 if ':' in authority:
                     host, port_str = authority.rsplit(':', 1)
                     try:
@@ -191,71 +339,58 @@ class ParsingMixin:
                     except ValueError:
                         raise ProxyParsingError(f"Invalid port '{port_str}' after manual parse.") from e
                 else:
-                    raise ProxyParsingError("No port found in trojan URI.") from e
+                    raise ProxyParsingError(f"No port found in {scheme} URI.") from e
             else:
-                raise ProxyParsingError("Error parsing trojan port.") from e
-
-        if not all((password, host, port)):
-            raise ProxyParsingError("Incomplete trojan:// link (password, host, or port missing).")
+                raise ProxyParsingError(f"Error parsing {scheme} port.") from e
+        return user, host, port
 
-        params = parse_qs(parsed.query)
-        tag = self._sanitize_tag(unquote(parsed.fragment) if parsed.fragment else None, "trojan")
-        stream_settings = self._build_stream_settings(params, host)
-
-        config = {
-            "tag": tag,
-            "protocol": "trojan",
-            "settings": {
-                "servers": [{
-                    "address": host,
-                    "port": port,
-                    "password": password,
-                    "flow": params.get("flow", [""])[0],
-                }]
-            },
-            "streamSettings": stream_settings
-        }
-        return Outbound(tag=tag, config=config, protocol="trojan", host=host, port=port)
-
-    def _build_stream_settings(
-        self, params: Dict[str, List[str]], host: str
-    ) -> Dict[str, Any]:
+    @staticmethod
+    def _build_stream_settings(params: Dict[str, str], host: str) -> Dict[str, Any]:
         """Creates the streamSettings structure based on URI parameters."""
-        network = params.get("type", ["tcp"])[0]
+        network = params.get("type", "tcp")
         if network == "none":
             network = "tcp"  # Map 'none' to valid 'tcp' for plain connections
-        security = params.get("security", [""])[0]
-        sni = params.get("sni", [host])[0] or host
+        security = params.get("security", "")
+        sni = params.get("sni", host) or host
 
         stream: Dict[str, Any] = {"network": network}
 
         if network == "ws":
-            ws_host = params.get("host", [sni])[0]
+            ws_host = params.get("host", sni)
             stream["wsSettings"] = {
-                "path": params.get("path", ["/"])[0],
+                "path": params.get("path", "/"),
                 "headers": {"Host": ws_host or sni},
             }
         elif network == "grpc":
-            stream["grpcSettings"] = {"serviceName": params.get("serviceName", [""])[0]}
+            stream["grpcSettings"] = {"serviceName": params.get("serviceName", "")}
 
-        if security in ("tls", "reality"):
+        settings_key = _SECURITY_SETTINGS_KEYS.get(security)
+        if settings_key is not None:
             stream["security"] = security
-            settings_key = f"{security}Settings"
             sec_settings: Dict[str, Any] = {"serverName": sni}
 
-            if alpn_list := params.get("alpn"):
-                sec_settings["alpn"] = alpn_list
-            if fp := params.get("fp", [""])[0]:
+            alpn = params.get("alpn")
+            if alpn is not None:
+                sec_settings["alpn"] = alpn.split(",")
+            if fp := params.get("fp", ""):
                 sec_settings["fingerprint"] = fp
-            if params.get("allowInsecure", ["0"])[0] == "1":
+            if params.get("allowInsecure", "0") == "1":
                 sec_settings["allowInsecure"] = True
 
             if security == "reality":
                 sec_settings.update({
-                    "publicKey": params.get("pbk", [""])[0],
-                    "shortId": params.get("sid", [""])[0],
-                    "spiderX": params.get("spx", ["/"])[0],
+                    "publicKey": params.get("pbk", ""),
+                    "shortId": params.get("sid", ""),
+                    "spiderX": params.get("spx", "/"),
                 })
             stream[settings_key] = sec_settings
 
-        return stream
\ No newline at end of file
+        return stream
+
+    # Scheme -> parser, built once instead of a getattr on an f-string per URI.
+    _SCHEME_DISPATCH = {
+        "ss": _parse_ss,
+        "vmess": _parse_vmess,
+        "vless": _parse_vless,
+        "trojan": _parse_trojan,
+    }
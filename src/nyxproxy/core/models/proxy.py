@@ -13,12 +13,23 @@ from typing import Any, Dict, Optional
 class Outbound:
     """Represents a parsed outbound configuration for Xray."""
 
+    # One per loaded proxy, so no per-instance __dict__.
+    __slots__ = ("tag", "config", "protocol", "host", "port")
+
     tag: str
     config: Dict[str, Any]
     protocol: str
     host: str
     port: int
 
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        # Frozen: the default unpickling would go through the blocked __setattr__.
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 @dataclass
 class BridgeRuntime:
@@ -71,4 +82,10 @@ class TestResult:
     error: Optional[str] = None
     server_geo: Optional[GeoInfo] = None
     exit_geo: Optional[GeoInfo] = None
-    tested_at_ts: Optional[float] = None
\ No newline at end of file
+    tested_at_ts: Optional[float] = None
+
+    @property
+    def country_label(self) -> str:
+        """Label of the exit location, falling back to the server's, or '-'."""
+        geo = self.exit_geo or self.server_geo
+        return geo.label if geo else "-"
\ No newline at end of file
@@ -14,7 +14,6 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import aiofiles
 from rich import box
 from rich.panel import Panel
 from rich.table import Table
@@ -28,6 +27,9 @@ from .load_balancer import BridgeLoadBalancer
 class BridgeMixin:
     """Functionality related to the lifecycle of Xray bridges."""
 
+    # Maximum number of bridges restarted in parallel by rotate_all_proxies.
+    _ROTATE_ALL_CONCURRENCY = 8
+
     @staticmethod
     def _decode_bytes(data: Optional[bytes]) -> str:
         """Decodes bytes to a string, ignoring errors."""
@@ -351,11 +353,12 @@ class BridgeMixin:
 
         bridges_runtime = await self._launch_and_monitor_bridges(approved_entries)
         self._bridges = bridges_runtime
+        self._bridges_version += 1
         self._running = True
 
         # Note: We don't print the initial summary here anymore because:
         # - For 'start' command: InteractiveUI will display it immediately
-        # - For 'chains' command: _display_proxies_table() is called separately
+        # - For 'chains' command: the proxychains dashboard shows the bridges
 
         bridges_with_id = [
             {"id": idx, "url": bridge.url, "uri": bridge.uri, "tag": bridge.tag}
@@ -371,7 +374,7 @@ class BridgeMixin:
         if not self.console:
             return None
 
-        entry_map = {e.uri: e for e in self._entries}
+        entry_map = self._get_entry_map()
 
         rows_table = Table(
             show_header=True,
@@ -403,10 +406,7 @@ class BridgeMixin:
             if entry:
                 destination = self._format_destination(entry.host, entry.port)
                 tag = entry.tag or tag
-                if entry.exit_geo:
-                    country = f"{entry.exit_geo.emoji} {entry.exit_geo.label}" if hasattr(entry.exit_geo, 'emoji') else entry.exit_geo.label
-                elif entry.server_geo:
-                    country = f"{entry.server_geo.emoji} {entry.server_geo.label}" if hasattr(entry.server_geo, 'emoji') else entry.server_geo.label
+                country = entry.country_label
                 if entry.ping is not None:
                     ping = f"{entry.ping:.0f}ms"
 
@@ -495,6 +495,7 @@ class BridgeMixin:
                 await self._release_port(bridge.port)
 
         self._bridges = []
+        self._bridges_version += 1
         self._running = False
 
     def get_http_proxy(self) -> List[Dict[str, Any]]:
@@ -552,8 +553,8 @@ class BridgeMixin:
         """Initializes Xray with stdout/stderr capture for better diagnostics."""
         tmpdir = Path(tempfile.mkdtemp(prefix=f"xray_{name}_"))
         cfg_path = tmpdir / "config.json"
-        async with aiofiles.open(cfg_path, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(cfg, ensure_ascii=False, indent=2))
+        # A few KB written once per bridge: a direct write beats a thread-pool hop.
+        cfg_path.write_text(json.dumps(cfg, ensure_ascii=False, indent=2), encoding="utf-8")
 
         proc = await asyncio.create_subprocess_exec(  # nosec B603
             xray_bin,
@@ -573,28 +574,37 @@ class BridgeMixin:
         2. Tries to fetch from sources and test them
         3. Clears the used queue and restarts the cycle
         
-        Uses a lock to prevent race conditions when multiple rotations run in parallel.
+        The lock only covers picking and reserving the new proxy; restarting
+        the Xray process happens outside it, so parallel rotations (e.g.
+        "rotate all") restart their bridges concurrently.
         """
-        # Use lock to prevent race conditions during parallel rotations (e.g., "rotate all")
+        # Use lock to prevent race conditions while choosing proxies in parallel rotations
         async with self._rotation_lock:
             if not self._running or not (0 <= bridge_id < len(self._bridges)):
                 msg = f"Invalid bridge ID: {bridge_id}. Valid IDs: 0 to {len(self._bridges) - 1}."
                 self._print_or_status(f"[feedback.error]Error: {msg}[/feedback.error]")
                 return False
+            if bridge_id in self._rotation_reservations:
+                self._print_or_status(
+                    f"[warning]Bridge {bridge_id} is already being rotated.[/warning]"
+                )
+                return False
 
             bridge = self._bridges[bridge_id]
             old_uri = bridge.uri
             
             # Combine currently active URIs with recently used URIs from the queue
-            used_uris = {b.uri for b in self._bridges}
+            # Proxies already picked by in-flight rotations count as active too
+            reserved_uris = set(self._rotation_reservations.values())
+            used_uris = {b.uri for b in self._bridges} | reserved_uris
             used_uris.update(self._used_proxies_queue)
             
             # Also track used destinations (server:port) to avoid duplicates
             # Get destinations from active bridges
             used_destinations = set()
-            entry_map = {e.uri: e for e in self._entries}
-            for b in self._bridges:
-                entry = entry_map.get(b.uri)
+            entry_map = self._get_entry_map()
+            for uri in [b.uri for b in self._bridges] + list(reserved_uris):
+                entry = entry_map.get(uri)
                 if entry and entry.host and entry.port:
                     used_destinations.add(f"{entry.host}:{entry.port}")
 
@@ -684,7 +694,7 @@ class BridgeMixin:
                 self._used_proxies_queue.clear()
                 
                 # Update used_uris to only include active bridges
-                used_uris = {b.uri for b in self._bridges}
+                used_uris = {b.uri for b in self._bridges} | reserved_uris
                 
                 # Try to get candidates again
                 candidates = get_candidates()
@@ -707,6 +717,10 @@ class BridgeMixin:
             if not new_outbound:
                 return False  # Should not happen if entries and outbounds are in sync
 
+            # Reserve the pick so parallel rotations choose different proxies
+            self._rotation_reservations[bridge_id] = new_entry.uri
+
+        try:
             # Terminate old bridge
             await self._terminate_process(bridge.process, wait_timeout=2)
             self._safe_remove_dir(bridge.workdir)
@@ -737,15 +751,34 @@ class BridgeMixin:
                 process=new_proc,
                 workdir=new_cfg_path.parent,
             )
-            
-            # Add old URI to the used queue
-            self._used_proxies_queue.append(old_uri)
-            
-            queue_size = len(self._used_proxies_queue)
-            self._print_or_status(
-                f"[success]✓ Rotated bridge {bridge_id} ({queue_size} proxies in history)[/success]"
-            )
-            return True
+        finally:
+            self._rotation_reservations.pop(bridge_id, None)
+            # Even a failed rotation may have re-tested the entries shown in the summary.
+            self._bridges_version += 1
+
+        # Add old URI to the used queue
+        self._used_proxies_queue.append(old_uri)
+
+        queue_size = len(self._used_proxies_queue)
+        self._print_or_status(
+            f"[success]✓ Rotated bridge {bridge_id} ({queue_size} proxies in history)[/success]"
+        )
+        return True
+
+    async def rotate_all_proxies(self) -> List[bool]:
+        """Rotates every running bridge, restarting at most a few Xray processes at once.
+
+        Each rotation restarts an Xray process, so fanning out one per bridge at
+        once makes them compete for CPU and disk; the semaphore caps that at
+        ``_ROTATE_ALL_CONCURRENCY``.
+        """
+        semaphore = asyncio.Semaphore(self._ROTATE_ALL_CONCURRENCY)
+
+        async def _bounded(bridge_id: int) -> bool:
+            async with semaphore:
+                return await self.rotate_proxy(bridge_id)
+
+        return await asyncio.gather(*(_bounded(i) for i in range(len(self._bridges))))
     
     async def adjust_bridge_amount(self, target_amount: int) -> str:
         """Adjusts the number of active bridges to the target amount.
@@ -783,6 +816,7 @@ class BridgeMixin:
             
             # Remove from the list
             self._bridges = self._bridges[:target_amount]
+            self._bridges_version += 1
             return f"✓ Reduced to {target_amount} bridges"
         
         else:
@@ -834,6 +868,7 @@ class BridgeMixin:
             
             if new_bridges:
                 self._bridges.extend(new_bridges)
+                self._bridges_version += 1
                 actual_amount = len(self._bridges)
                 if actual_amount == target_amount:
                     return f"✓ Increased to {actual_amount} bridges"
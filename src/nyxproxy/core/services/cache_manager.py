@@ -66,6 +66,14 @@ class CacheMixin:
             self._apply_cached_data(result, cached_data)
 
         self._entries.append(result)
+        if self._entry_by_uri is not None:
+            self._entry_by_uri[raw_uri] = result
+
+    def _get_entry_map(self) -> Dict[str, TestResult]:
+        """Returns the URI -> entry index, rebuilt only after bulk changes to `_entries`."""
+        if self._entry_by_uri is None:
+            self._entry_by_uri = {e.uri: e for e in self._entries}
+        return self._entry_by_uri
 
     def _prime_entries_from_cache(self) -> None:
         """Reconstructs records from the cache without re-parsing."""
@@ -79,6 +87,7 @@ class CacheMixin:
                 self._apply_cached_data(result, cached)
             rebuilt.append(result)
         self._entries = rebuilt
+        self._entry_by_uri = None
 
     def _load_outbounds_from_cache(self) -> None:
         """Loads outbounds directly from cache when no sources are given."""
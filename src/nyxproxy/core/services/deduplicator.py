@@ -2,17 +2,78 @@ import json
 import os
 import hashlib
 import time
-import base64
 import urllib.parse
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
 from multiprocessing import Pool, cpu_count
 
+try:
+    # SIMD-accelerated drop-in for the stdlib module (optional "speed" extra).
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    import orjson
+except ImportError:  # optional "speed" extra
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # optional "speed" extra
+    xxhash = None
+
+# Fields that identify a config; configs with equal values are duplicates.
+_KEY_FIELDS = (
+    'type', 'server', 'port', 'uuid', 'password', 'network',
+    'path', 'host', 'tls', 'sni', 'alpn'
+)
+
+def _dumps_compact(data):
+    """Compact JSON as UTF-8 bytes, ready to be base64-encoded."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits) take the stdlib path.
+            pass
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def _b64(text):
+    """Standard base64 of a UTF-8 string, kept as bytes."""
+    return base64.b64encode(text.encode('utf-8'))
+
+# Remarks, SNIs and hosts repeat heavily across deduplicated lists, so the
+# percent-encoding used when rebuilding URLs is memoized per value.
+@lru_cache(maxsize=16384)
+def _quote_query_value(value):
+    return urllib.parse.quote_plus(value, safe='')
+
+@lru_cache(maxsize=16384)
+def _quote_fragment(value):
+    return urllib.parse.quote(value)
+
+def _encode_query(params):
+    """Same output as urlencode() for the reconstructors' fixed, URL-safe keys."""
+    return '&'.join([f"{key}={_quote_query_value(str(value))}" for key, value in params.items()])
+
 def generate_hash_worker(config):
-    key_string = ConfigDeduplicator.get_config_key_string(config)
-    return hashlib.md5(key_string.encode('utf-8')).hexdigest()
+    key_bytes = ConfigDeduplicator.get_config_key_string(config).encode('utf-8')
+    if xxhash is not None:
+        # 128 bits keeps md5's collision margin; an int is also cheaper to send back.
+        return xxhash.xxh3_128_intdigest(key_bytes)
+    return hashlib.md5(key_bytes).hexdigest()
+
+def reconstruct_url_worker(config):
+    return ConfigDeduplicator.reconstruct_config_url(config)
 
 class ConfigDeduplicator:
+    # Above this many configs, find_duplicates hashes keys in a process pool.
+    _HASH_POOL_MIN = 200_000
+    # Minimum batch size for which reconstruct_all uses a process pool.
+    _RECONSTRUCT_POOL_MIN = 20_000
+
     def __init__(self, configs_list, output_dir=None, console=None):
         package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         if output_dir is None:
@@ -36,26 +97,36 @@ class ConfigDeduplicator:
             protocol = config.get('type', 'unknown')
             self.stats['protocols'][protocol] += 1
 
+    @staticmethod
+    def get_config_key(config):
+        return tuple([config.get(key, '') for key in _KEY_FIELDS])
+
     @staticmethod
     def get_config_key_string(config):
-        keys_to_hash = [
-            'type', 'server', 'port', 'uuid', 'password', 'network',
-            'path', 'host', 'tls', 'sni', 'alpn'
-        ]
-        parts = [f"{key}:{config.get(key, '')}" for key in keys_to_hash]
-        return '|'.join(parts)
+        # repr() of the same tuple as get_config_key: values are quoted and
+        # escaped, so a separator inside a value cannot merge two configs.
+        return repr(ConfigDeduplicator.get_config_key(config))
 
     def find_duplicates(self):
         self._prepare_configs()
 
-        with Pool(cpu_count()) as pool:
-            hashes = list(pool.imap(generate_hash_worker, self.configs, chunksize=100))
-
+        # _original_index is the only bookkeeping field: config_score uses it
+        # to prefer earlier configs among equals.
         hash_to_configs = defaultdict(list)
-        for i, (config, config_hash) in enumerate(zip(self.configs, hashes)):
-            config['_hash'] = config_hash
-            config['_original_index'] = i
-            hash_to_configs[config_hash].append(config)
+        if len(self.configs) > self._HASH_POOL_MIN:
+            # Digests are grouped as they stream back instead of being collected
+            # into a list first.
+            with Pool(cpu_count()) as pool:
+                hashes = pool.imap(generate_hash_worker, self.configs, chunksize=200)
+                for i, (config, config_hash) in enumerate(zip(self.configs, hashes)):
+                    config['_original_index'] = i
+                    hash_to_configs[config_hash].append(config)
+        else:
+            # The key tuple is hashed by the dict itself; no digest or IPC needed.
+            get_key = self.get_config_key
+            for i, config in enumerate(self.configs):
+                config['_original_index'] = i
+                hash_to_configs[get_key(config)].append(config)
 
         for config_hash, configs_group in hash_to_configs.items():
             if len(configs_group) > 1:
@@ -70,52 +141,56 @@ class ConfigDeduplicator:
 
     @staticmethod
     def config_score(config):
-        score = 0
-        if config.get('remarks', '').strip():
-            score += 10
-        score += sum(1 for v in config.values() if v and str(v).strip() and not str(v).startswith('_'))
+        # max() already calls this once per member of a duplicate group, so it is
+        # not precomputed for every config (most groups are singletons); each
+        # value is converted to text once instead of twice.
+        score = 10 if config.get('remarks', '').strip() else 0
+        for value in config.values():
+            if value:
+                text = value if isinstance(value, str) else str(value)
+                if text.strip() and not text.startswith('_'):
+                    score += 1
         score -= config.get('_original_index', 0) * 0.001
         return score
 
     def clean_config(self, config):
-        cleaned = config.copy()
-        for key in list(cleaned.keys()):
-            if key.startswith('_'):
-                del cleaned[key]
-        return cleaned
+        # Bookkeeping keys all start with '_'; a one-char slice is cheaper than
+        # startswith() and, unlike k[0], safe for an empty key.
+        return {k: v for k, v in config.items() if k[:1] != '_'}
 
-    def reconstruct_config_url(self, config):
+    @classmethod
+    def reconstruct_config_url(cls, config):
         try:
-            config_copy = config.copy()
-            protocol = config_copy.get('type', '')
+            # The reconstructors only read the config (vmess copies raw_config
+            # before editing it), so no defensive copy is needed here.
+            protocol = config.get('type', '')
             if protocol == 'vmess':
-                return self.reconstruct_vmess_url(config_copy)
+                return cls.reconstruct_vmess_url(config)
             elif protocol == 'vless':
-                return self.reconstruct_vless_url(config_copy)
+                return cls.reconstruct_vless_url(config)
             elif protocol == 'trojan':
-                return self.reconstruct_trojan_url(config_copy)
+                return cls.reconstruct_trojan_url(config)
             elif protocol == 'shadowsocks':
-                return self.reconstruct_shadowsocks_url(config_copy)
+                return cls.reconstruct_shadowsocks_url(config)
             elif protocol == 'ssr':
-                return self.reconstruct_ssr_url(config_copy)
+                return cls.reconstruct_ssr_url(config)
             elif protocol == 'tuic':
-                return self.reconstruct_tuic_url(config_copy)
+                return cls.reconstruct_tuic_url(config)
             elif protocol == 'hysteria2':
-                return self.reconstruct_hysteria2_url(config_copy)
+                return cls.reconstruct_hysteria2_url(config)
             else:
                 return None
         except Exception as e:
             return None
 
-    def reconstruct_vmess_url(self, config):
+    @staticmethod
+    def reconstruct_vmess_url(config):
         try:
             if 'raw_config' in config and isinstance(config['raw_config'], dict):
                 raw_config_copy = config['raw_config'].copy()
                 if config.get('remarks'):
                     raw_config_copy['ps'] = config['remarks']
-                raw_json = json.dumps(raw_config_copy, separators=(',', ':'))
-                encoded = base64.b64encode(raw_json.encode('utf-8')).decode('utf-8')
-                return f"vmess://{encoded}"
+                return "vmess://" + base64.b64encode(_dumps_compact(raw_config_copy)).decode('ascii')
             else:
                 vmess_data = {
                     'v': '2',
@@ -134,13 +209,12 @@ class ConfigDeduplicator:
                     'alpn': config.get('alpn', ''),
                     'fp': config.get('fingerprint', '')
                 }
-                raw_json = json.dumps(vmess_data, separators=(',', ':'))
-                encoded = base64.b64encode(raw_json.encode('utf-8')).decode('utf-8')
-                return f"vmess://{encoded}"
+                return "vmess://" + base64.b64encode(_dumps_compact(vmess_data)).decode('ascii')
         except:
             return None
 
-    def reconstruct_vless_url(self, config):
+    @staticmethod
+    def reconstruct_vless_url(config):
         try:
             server = config.get('server', '')
             port = config.get('port', 443)
@@ -158,8 +232,8 @@ class ConfigDeduplicator:
             if config.get('fingerprint'): params['fp'] = config['fingerprint']
             if config.get('headerType'): params['headerType'] = config['headerType']
             if config.get('serviceName'): params['serviceName'] = config['serviceName']
-            query_string = urllib.parse.urlencode(params) if params else ''
-            fragment = urllib.parse.quote(remarks) if remarks else ''
+            query_string = _encode_query(params)
+            fragment = _quote_fragment(remarks) if remarks else ''
             url = f"vless://{uuid}@{server}:{port}"
             if query_string:
                 url += f"?{query_string}"
@@ -169,7 +243,8 @@ class ConfigDeduplicator:
         except:
             return None
 
-    def reconstruct_trojan_url(self, config):
+    @staticmethod
+    def reconstruct_trojan_url(config):
         try:
             server = config.get('server', '')
             port = config.get('port', 443)
@@ -183,8 +258,8 @@ class ConfigDeduplicator:
             if config.get('network'): params['type'] = config['network']
             if config.get('path'): params['path'] = config['path']
             if config.get('host'): params['host'] = config['host']
-            query_string = urllib.parse.urlencode(params) if params else ''
-            fragment = urllib.parse.quote(remarks) if remarks else ''
+            query_string = _encode_query(params)
+            fragment = _quote_fragment(remarks) if remarks else ''
             url = f"trojan://{password}@{server}:{port}"
             if query_string:
                 url += f"?{query_string}"
@@ -194,23 +269,24 @@ class ConfigDeduplicator:
         except:
             return None
 
-    def reconstruct_shadowsocks_url(self, config):
+    @staticmethod
+    def reconstruct_shadowsocks_url(config):
         try:
             server = config.get('server', '')
             port = config.get('port', 8080)
             method = config.get('method', 'aes-256-gcm')
             password = config.get('password', '')
             remarks = config.get('remarks', '')
-            auth_string = f"{method}:{password}"
-            encoded_auth = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
+            encoded_auth = _b64(f"{method}:{password}").decode('ascii')
             url = f"ss://{encoded_auth}@{server}:{port}"
             if remarks:
-                url += f"#{urllib.parse.quote(remarks)}"
+                url += f"#{_quote_fragment(remarks)}"
             return url
         except:
             return None
 
-    def reconstruct_ssr_url(self, config):
+    @staticmethod
+    def reconstruct_ssr_url(config):
         try:
             server = config.get('server', '')
             port = config.get('port', 8080)
@@ -218,30 +294,24 @@ class ConfigDeduplicator:
             method = config.get('method', 'aes-256-cfb')
             obfs = config.get('obfs', 'plain')
             password = config.get('password', '')
-            password_b64 = base64.b64encode(password.encode('utf-8')).decode('utf-8')
-            main_part = f"{server}:{port}:{protocol}:{method}:{obfs}:{password_b64}"
+            # Built as bytes: the inner base64 fields are encoded again as a
+            # whole, so they never need a round trip through str.
+            main_part = f"{server}:{port}:{protocol}:{method}:{obfs}:".encode('utf-8') + _b64(password)
             params = []
             if config.get('obfs_param'):
-                obfsparam_b64 = base64.b64encode(config['obfs_param'].encode('utf-8')).decode('utf-8')
-                params.append(f"obfsparam={obfsparam_b64}")
+                params.append(b"obfsparam=" + _b64(config['obfs_param']))
             if config.get('protocol_param'):
-                protoparam_b64 = base64.b64encode(config['protocol_param'].encode('utf-8')).decode('utf-8')
-                params.append(f"protoparam={protoparam_b64}")
-            remarks_b64 = base64.b64encode(config.get('remarks', '').encode('utf-8')).decode('utf-8')
-            params.append(f"remarks={remarks_b64}")
+                params.append(b"protoparam=" + _b64(config['protocol_param']))
+            params.append(b"remarks=" + _b64(config.get('remarks', '')))
             if config.get('group'):
-                group_b64 = base64.b64encode(config['group'].encode('utf-8')).decode('utf-8')
-                params.append(f"group={group_b64}")
-            if params:
-                full_string = f"{main_part}/?{'&'.join(params)}"
-            else:
-                full_string = main_part
-            encoded = base64.b64encode(full_string.encode('utf-8')).decode('utf-8')
-            return f"ssr://{encoded}"
+                params.append(b"group=" + _b64(config['group']))
+            full_string = main_part + b"/?" + b"&".join(params)
+            return "ssr://" + base64.b64encode(full_string).decode('ascii')
         except:
             return None
 
-    def reconstruct_tuic_url(self, config):
+    @staticmethod
+    def reconstruct_tuic_url(config):
         try:
             server = config.get('server', '')
             port = config.get('port', 443)
@@ -256,8 +326,8 @@ class ConfigDeduplicator:
             if config.get('congestion_control'): params['congestion_control'] = config['congestion_control']
             if config.get('udp_relay_mode'): params['udp_relay_mode'] = config['udp_relay_mode']
             if config.get('reduce_rtt'): params['reduce_rtt'] = '1'
-            query_string = urllib.parse.urlencode(params) if params else ''
-            fragment = urllib.parse.quote(remarks) if remarks else ''
+            query_string = _encode_query(params)
+            fragment = _quote_fragment(remarks) if remarks else ''
             auth_part = f"{uuid}:{password}" if password else uuid
             url = f"tuic://{auth_part}@{server}:{port}"
             if query_string:
@@ -268,7 +338,8 @@ class ConfigDeduplicator:
         except:
             return None
 
-    def reconstruct_hysteria2_url(self, config):
+    @staticmethod
+    def reconstruct_hysteria2_url(config):
         try:
             server = config.get('server', '')
             port = config.get('port', 443)
@@ -282,8 +353,8 @@ class ConfigDeduplicator:
             if config.get('obfs_password'): params['obfs-password'] = config['obfs_password']
             if config.get('up'): params['up'] = config['up']
             if config.get('down'): params['down'] = config['alpn']
-            query_string = urllib.parse.urlencode(params) if params else ''
-            fragment = urllib.parse.quote(remarks) if remarks else ''
+            query_string = _encode_query(params)
+            fragment = _quote_fragment(remarks) if remarks else ''
             url = f"hysteria2://{auth}@{server}:{port}"
             if query_string:
                 url += f"?{query_string}"
@@ -293,6 +364,20 @@ class ConfigDeduplicator:
         except:
             return None
 
+    def reconstruct_all(self, configs=None):
+        """Rebuilds the URL of every config (unique ones by default), in order.
+
+        Entries that cannot be rebuilt are None. Large batches are spread over
+        a process pool like the hashing phase; below _RECONSTRUCT_POOL_MIN
+        configs the pool start-up costs more than it saves.
+        """
+        if configs is None:
+            configs = self.unique_configs
+        if len(configs) < self._RECONSTRUCT_POOL_MIN:
+            return [self.reconstruct_config_url(c) for c in configs]
+        with Pool(cpu_count()) as pool:
+            return list(pool.imap(reconstruct_url_worker, configs, chunksize=500))
+
     def process(self):
         try:
             self.find_duplicates()
@@ -315,9 +400,10 @@ class ConfigDeduplicator:
         Returns:
             The summary message, or empty string if no duplicates removed.
         """
-        reduction_rate = (self.stats['duplicates_removed'] / self.stats['total_configs']) * 100 if self.stats['total_configs'] > 0 else 0
-        
         if self.stats['duplicates_removed'] > 0:
+            # Only formatted when there is something to report; duplicates imply
+            # total_configs > 0.
+            reduction_rate = (self.stats['duplicates_removed'] / self.stats['total_configs']) * 100
             message = (
                 f"[info]Removed {self.stats['duplicates_removed']:,} duplicate proxies "
                 f"({self.stats['unique_configs']:,} unique configs remaining, a {reduction_rate:.1f}% reduction)."
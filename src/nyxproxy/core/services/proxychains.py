@@ -2,111 +2,89 @@ from __future__ import annotations
 
 """Routines for integration with the proxychains utility."""
 
+import atexit
+import codecs
+import os
 import shutil
 import subprocess  # nosec B404
+import sys
 import tempfile
+import time
 import asyncio
 from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Deque, List, Tuple
+from typing import ClassVar, Deque, List, Optional
 
-import aiofiles
-from rich.live import Live
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
-
-from ..config.settings import PROXYCHAINS_CONF_TEMPLATE
+from ..config.settings import PROXYCHAINS_CONF_HEAD, PROXYCHAINS_CONF_TAIL
 from ..config.exceptions import InsufficientProxiesError, ProxyChainsError
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
 
-class ChainsMixin:
-    """Functionality to execute commands through proxychains."""
+# Linux-only fcntl command; not exposed by the stdlib before Python 3.10.
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+_PIPE_BUFFER_SIZE = 1 << 20
 
-    def _display_proxies_table(self) -> None:
-        """Exibe uma tabela organizada dos proxies ativos."""
-        if not self.console or not self._bridges:
-            return
+# Markup placed before each captured output line, by stream.
+_OUTPUT_LINE_PREFIXES = {
+    "STDOUT": "[feedback.success]▶[/] [text.secondary]",
+    "STDERR": "[feedback.error]⚠[/] [text.secondary]",
+}
 
-        entry_map = {e.uri: e for e in self._entries}
+# Typed characters are almost always ASCII; a set lookup skips the Unicode
+# database, which isprintable() still covers for everything else.
+_PRINTABLE_ASCII = frozenset(map(chr, range(0x20, 0x7F)))
 
-        table = Table(
-            show_header=True,
-            header_style="table.header",
-            box=box.ROUNDED,
-            expand=True,
-            pad_edge=False,
-            show_lines=False,
-        )
-        table.add_column(
-            "ID", style="table.row.id", no_wrap=True, justify="center", width=4
-        )
-        table.add_column("URL", style="table.row.url", no_wrap=True, width=22)
-        table.add_column("Tag", style="table.row.tag", width=20)
-        table.add_column("Destination", style="table.row.dest", width=25)
-        table.add_column("Country", style="table.row.country", no_wrap=True, width=15)
-        table.add_column(
-            "Ping", style="table.row.ping", justify="right", no_wrap=True, width=10
-        )
 
-        for idx, bridge in enumerate(self._bridges):
-            entry = entry_map.get(bridge.uri)
-            destination = "-"
-            country = "-"
-            ping = "-"
-            tag = bridge.tag
-
-            if entry:
-                destination = self._format_destination(entry.host, entry.port)
-                tag = entry.tag or tag
-                if entry.exit_geo:
-                    country = (
-                        f"{entry.exit_geo.emoji} {entry.exit_geo.label}"
-                        if hasattr(entry.exit_geo, "emoji")
-                        else entry.exit_geo.label
-                    )
-                elif entry.server_geo:
-                    country = (
-                        f"{entry.server_geo.emoji} {entry.server_geo.label}"
-                        if hasattr(entry.server_geo, "emoji")
-                        else entry.server_geo.label
-                    )
-                if entry.ping is not None:
-                    ping = f"{entry.ping:.0f}ms"
-
-            # Truncate long strings
-            tag = tag[:18] + ".." if len(tag) > 20 else tag
-            destination = destination[:23] + ".." if len(destination) > 25 else destination
-
-            table.add_row(
-                f"{idx}",
-                bridge.url,
-                tag,
-                destination,
-                country,
-                ping,
-            )
+@lru_cache(maxsize=1)
+def _find_proxychains() -> str:
+    """
+    Scans PATH for proxychains4 or proxychains once per process.
 
-        total_bridges = len(self._bridges)
-        title = f"[primary]Proxies Ativos[/] [highlight]({total_bridges})[/]"
+    Failures are not cached, so a later call retries after an install;
+    ``_find_proxychains.cache_clear()`` forces a new scan.
+    """
+    for candidate in ("proxychains4", "proxychains"):
+        if found := shutil.which(candidate):
+            return found
+    raise ProxyChainsError(
+        "Command 'proxychains4' or 'proxychains' not found. "
+        "Ensure it is installed and in your PATH."
+    )
 
-        panel = Panel(
-            table,
-            title=title,
-            border_style="border",
-            padding=(0, 1),
-        )
-        self.console.print(panel)
+
+class ChainsMixin:
+    """Functionality to execute commands through proxychains."""
+
+    # Private config directory; created once per process and removed at exit
+    # instead of after every run.
+    _chains_tmpdir: ClassVar[Optional[Path]] = None
 
     def _which_proxychains(self) -> str:
         """Locates the proxychains4 or proxychains binary."""
-        for candidate in ("proxychains4", "proxychains"):
-            if found := self._shutil_which(candidate):
-                return found
-        raise ProxyChainsError(
-            "Command 'proxychains4' or 'proxychains' not found. "
-            "Ensure it is installed and in your PATH."
-        )
+        return _find_proxychains()
+
+    @staticmethod
+    def _enlarge_pipe_buffer(fd: int) -> None:
+        """Grows the kernel buffer of a pipe (Linux only)."""
+        if fcntl is None:
+            return
+        try:
+            fcntl.fcntl(fd, _F_SETPIPE_SZ, _PIPE_BUFFER_SIZE)
+        except OSError:
+            # Not supported here, or above /proc/sys/fs/pipe-max-size.
+            pass
+
+    @staticmethod
+    def _chains_config_file() -> Path:
+        """Returns the reusable config path, creating its directory once."""
+        if ChainsMixin._chains_tmpdir is None:
+            ChainsMixin._chains_tmpdir = Path(tempfile.mkdtemp(prefix="nyxproxy_chains_"))
+            atexit.register(shutil.rmtree, ChainsMixin._chains_tmpdir, ignore_errors=True)
+        return ChainsMixin._chains_tmpdir / "proxychains.conf"
 
     async def run_with_chains(
         self,
@@ -116,10 +94,14 @@ class ChainsMixin:
         amounts: int = 1,
         country: str | None = None,
         skip_geo: bool = True,
+        live_ui: bool = True,
     ) -> int:
         """
         Starts bridges, creates a proxychains config, and executes a command.
 
+        With `live_ui` disabled (or without a console) the command inherits
+        the terminal directly instead of being captured into the dashboard.
+
         Returns the exit code of the executed command.
         """
         if not cmd_list:
@@ -139,24 +121,22 @@ class ChainsMixin:
                 "No proxy bridges could be started for the chain."
             )
 
-        # Don't display table here - it will be shown in the interactive interface
-        # self._display_proxies_table()
-
-        tmpdir_path: Path | None = None
         try:
             proxychains_bin = self._which_proxychains()
 
-            proxy_lines = [f"http 127.0.0.1 {bridge.port}" for bridge in self._bridges]
-            config_content = PROXYCHAINS_CONF_TEMPLATE.format(
-                proxy_list="\n".join(proxy_lines)
-            ).strip()
+            # A list, not a generator: str.join materializes its input anyway.
+            proxy_list = "\n".join([f"http 127.0.0.1 {bridge.port}" for bridge in self._bridges])
+            # The halves are pre-stripped, so no .strip() pass over the result.
+            config_content = PROXYCHAINS_CONF_HEAD + proxy_list + PROXYCHAINS_CONF_TAIL
 
-            tmpdir_path = Path(tempfile.mkdtemp(prefix="nyxproxy_chains_"))
-            config_path = tmpdir_path / "proxychains.conf"
-            async with aiofiles.open(config_path, "w", encoding="utf-8") as f:
-                await f.write(config_content)
+            # A real file, unlike /proc/<pid>/fd/N, stays readable for commands
+            # that switch users or mount their own /proc; an unreadable config
+            # makes proxychains silently fall back to /etc/proxychains.conf.
+            config_file = self._chains_config_file()
+            # A few hundred bytes: one synchronous write beats a thread-pool hop.
+            config_file.write_text(config_content, encoding="utf-8")
 
-            full_command = [proxychains_bin, "-f", str(config_path), *cmd_list]
+            full_command = [proxychains_bin, "-f", str(config_file), *cmd_list]
 
             # Add execution message to initial status buffer
             if hasattr(self, '_initial_status_messages'):
@@ -165,68 +145,103 @@ class ChainsMixin:
                     cmd_display += '...'
                 self._initial_status_messages.append(f"Executing: {cmd_display}")
 
-            if not self.console:
-                process = await asyncio.create_subprocess_exec(*full_command)
-                await process.wait()
-                return process.returncode
+            if not self.console or not live_ui:
+                return await self._run_inherited(full_command)
+            return await self._run_captured(full_command)
 
-            # Use asyncio-based input handling
-            import sys
-            import os
-            try:
-                import termios
-                import tty
-                _UNIX = True
-            except ImportError:
-                _UNIX = False
-
-            input_buffer = ""
-            exit_flag = False
-            last_message = ""
-            message_time = 0
-            input_queue = asyncio.Queue()
-            scroll_offset = 0  # For scrolling through proxies list
-
-            tail_buffer: Deque[Tuple[str, str]] = deque(maxlen=5)
-            status_buffer: Deque[str] = deque(maxlen=5)  # Buffer for status messages
-            
-            # Create a simple object to hold status messages for _print_or_status
-            class StatusHolder:
-                def __init__(self):
-                    self.messages = status_buffer
-                def add_status_message(self, msg):
-                    self.messages.append(msg)
-            
-            self._interactive_ui = StatusHolder()  # Set reference for status messages
-            
-            # Transfer initial messages to status buffer
-            if hasattr(self, '_initial_status_messages'):
-                for msg in self._initial_status_messages:
-                    status_buffer.append(f"[text.secondary]{msg}[/]")
-                self._initial_status_messages.clear()
+        finally:
+            self._interactive_ui = None  # Clear reference
+            if self.console:
+                self.console.print(
+                    "\n[warning]Terminating bridges and cleaning up...[/]"
+                )
+            await self.stop()
 
-            def _handle_stdin():
-                """Callback for stdin reader."""
+    @staticmethod
+    async def _run_inherited(full_command: List[str]) -> int:
+        """Runs the command with the terminal's own stdio; no pipes or readers."""
+        process = await asyncio.create_subprocess_exec(*full_command)
+        return await process.wait()
+
+    async def _run_captured(self, full_command: List[str]) -> int:
+        """Runs the command with its output captured into the Live dashboard."""
+        # Imported here so commands that never open the dashboard skip it.
+        from rich.console import Group
+        from rich.live import Live
+        from rich.panel import Panel
+        from rich.text import Text
+
+        # Use asyncio-based input handling
+        try:
+            import termios
+            import tty
+            _UNIX = True
+        except ImportError:
+            _UNIX = False
+
+        # Typed characters; a list keeps append and backspace O(1).
+        input_buffer: List[str] = []
+        exit_flag = False
+        last_message = ""
+        message_time = 0
+        stdin_reader: Optional[asyncio.StreamReader] = None
+        pending_chars: Deque[str] = deque()  # Decoded keystrokes not handled yet
+        redraw = asyncio.Event()  # Set whenever something visible changes
+        scroll_offset = 0  # For scrolling through proxies list
+
+        # Fixed ring of formatted output lines; lines are formatted once on
+        # arrival and overwrite the oldest slot instead of churning a deque.
+        tail_size = 5
+        tail_buffer: List[Optional[str]] = [None] * tail_size
+        tail_index = 0  # Total lines written; the next slot is tail_index % tail_size
+        output_dirty = True
+        output_markup = ""
+        status_buffer: Deque[str] = deque(maxlen=5)  # Buffer for status messages
+
+        # Create a simple object to hold status messages for _print_or_status
+        class StatusHolder:
+            def __init__(self):
+                self.messages = status_buffer
+            def add_status_message(self, msg):
+                self.messages.append(msg)
+                redraw.set()
+
+        self._interactive_ui = StatusHolder()  # Set reference for status messages
+
+        # Transfer initial messages to status buffer
+        if hasattr(self, '_initial_status_messages'):
+            for msg in self._initial_status_messages:
+                status_buffer.append(f"[text.secondary]{msg}[/]")
+            self._initial_status_messages.clear()
+
+        decode_input = codecs.getincrementaldecoder("utf-8")(errors="ignore").decode
+
+        async def read_char(timeout: Optional[float] = None) -> Optional[str]:
+            """Returns the next typed character; None on timeout or end of input."""
+            while not pending_chars:
+                try:
+                    data = await asyncio.wait_for(stdin_reader.read(64), timeout)
+                except asyncio.TimeoutError:
+                    return None
+                if not data:
+                    return None
+                pending_chars.extend(decode_input(data))
+            return pending_chars.popleft()
+
+        async def _process_input():
+            """Process keystrokes read from the terminal."""
+            nonlocal exit_flag, last_message, message_time, scroll_offset
+
+            if stdin_reader is None:
+                return  # No terminal input on this platform
+
+            escape_sequence = ""
+
+            while not exit_flag:
+                char = await read_char()
+                if char is None:
+                    break  # End of input, also fed once the command is done
                 try:
-                    data = os.read(sys.stdin.fileno(), 1024)
-                    for char in data.decode(errors='ignore'):
-                        input_queue.put_nowait(char)
-                except (BlockingIOError, InterruptedError):
-                    pass
-
-            async def _process_input_queue():
-                """Process input from queue."""
-                nonlocal input_buffer, exit_flag, last_message, message_time, scroll_offset
-                
-                escape_sequence = ""
-                
-                while not exit_flag:
-                    try:
-                        char = await asyncio.wait_for(input_queue.get(), timeout=0.1)
-                    except asyncio.TimeoutError:
-                        escape_sequence = ""  # Reset escape sequence on timeout
-                        continue
-                    
                     # Handle escape sequences (arrow keys)
                     if escape_sequence:
                         escape_sequence += char
@@ -242,26 +257,25 @@ class ChainsMixin:
 
                     if char == '\x1b':  # ESC - start of escape sequence or exit
                         # Wait a moment to see if it's an escape sequence
-                        try:
-                            next_char = await asyncio.wait_for(input_queue.get(), timeout=0.05)
-                            if next_char == '[':  # Start of arrow key sequence
-                                escape_sequence = '['
-                            else:
-                                # Not an escape sequence, treat as ESC key
-                                exit_flag = True
-                                if next_char:  # Put back the character
-                                    input_queue.put_nowait(next_char)
-                        except asyncio.TimeoutError:
-                            # Just ESC key press
+                        next_char = await read_char(timeout=0.05)
+                        if next_char == '[':  # Start of arrow key sequence
+                            escape_sequence = '['
+                        else:
+                            # Not an escape sequence, treat as ESC key
                             exit_flag = True
+                            if next_char:  # Put back the character
+                                pending_chars.appendleft(next_char)
                     elif char in ('\r', '\n'):  # Enter
-                        command = input_buffer.strip().lower()
-                        input_buffer = ""
-                        
+                        command = "".join(input_buffer).strip().lower()
+                        input_buffer.clear()
+
                         if command:
-                            parts = command.split()
+                            # The grammar is "<verb> <action> <arg>", with arg running to the end.
+                            verb, _, rest = command.partition(" ")
+                            action, _, arg = rest.lstrip().partition(" ")
+                            arg = arg.strip()
                             try:
-                                if parts[0] == "help":
+                                if verb == "help":
                                     # Show available commands
                                     help_text = (
                                         "[primary]Available commands:[/]\n"
@@ -277,45 +291,44 @@ class ChainsMixin:
                                         "  [accent]ESC[/]                   - Exit the interface"
                                     )
                                     last_message = help_text
-                                    message_time = asyncio.get_running_loop().time() + 8
-                                elif len(parts) >= 2 and parts[0] == "source":
-                                    if parts[1] == "list":
+                                    message_time = time.monotonic() + 8
+                                elif verb == "source" and action:
+                                    if action == "list":
                                         last_message = self.list_sources()
-                                        message_time = asyncio.get_running_loop().time() + 5
-                                    elif parts[1] == "add" and len(parts) >= 3:
-                                        source_url = " ".join(parts[2:])  # Join in case URL has spaces
+                                        message_time = time.monotonic() + 5
+                                    elif action == "add" and arg:
+                                        source_url = arg
                                         last_message = f"[green]{self.add_source(source_url)}[/]"
-                                        message_time = asyncio.get_running_loop().time() + 3
-                                    elif parts[1] == "rem" and len(parts) >= 3:
+                                        message_time = time.monotonic() + 3
+                                    elif action == "rem" and arg:
                                         try:
-                                            source_id = int(parts[2])
+                                            source_id = int(arg)
                                             result = self.remove_source(source_id)
                                             if "✓" in result:
                                                 last_message = f"[green]{result}[/]"
                                             else:
                                                 last_message = f"[red]{result}[/]"
-                                            message_time = asyncio.get_running_loop().time() + 3
+                                            message_time = time.monotonic() + 3
                                         except ValueError:
                                             last_message = "[red]✗ Invalid source ID[/]"
-                                            message_time = asyncio.get_running_loop().time() + 2
+                                            message_time = time.monotonic() + 2
                                     else:
                                         last_message = "[yellow]? Usage: source [list|add <url>|rem <id>][/]"
-                                        message_time = asyncio.get_running_loop().time() + 2
-                                elif len(parts) >= 2 and parts[0] == "proxy":
-                                    if parts[1] == "rotate" and len(parts) >= 3:
-                                        target = parts[2]
+                                        message_time = time.monotonic() + 2
+                                elif verb == "proxy" and action:
+                                    if action == "rotate" and arg:
+                                        target = arg
                                         if target == "all":
-                                            tasks = [self.rotate_proxy(i) for i in range(len(self._bridges))]
-                                            await asyncio.gather(*tasks)
+                                            await self.rotate_all_proxies()
                                             last_message = "[green]✓[/] Rotated all proxies"
                                         else:
                                             bridge_id = int(target)
                                             await self.rotate_proxy(bridge_id)
                                             last_message = f"[green]✓[/] Rotated proxy {bridge_id}"
-                                        message_time = asyncio.get_running_loop().time() + 2
-                                    elif parts[1] == "amount" and len(parts) >= 3:
+                                        message_time = time.monotonic() + 2
+                                    elif action == "amount" and arg:
                                         try:
-                                            target_amount = int(parts[2])
+                                            target_amount = int(arg)
                                             result = await self.adjust_bridge_amount(target_amount)
                                             if "✓" in result:
                                                 last_message = f"[green]{result}[/]"
@@ -323,34 +336,34 @@ class ChainsMixin:
                                                 last_message = f"[yellow]{result}[/]"
                                             else:
                                                 last_message = f"[red]{result}[/]"
-                                            message_time = asyncio.get_running_loop().time() + 3
+                                            message_time = time.monotonic() + 3
                                         except ValueError:
                                             last_message = "[red]✗ Invalid amount (must be a number)[/]"
-                                            message_time = asyncio.get_running_loop().time() + 2
+                                            message_time = time.monotonic() + 2
                                     else:
                                         last_message = "[yellow]? Usage: proxy [rotate <id|all>|amount <number>][/]"
-                                        message_time = asyncio.get_running_loop().time() + 2
-                                elif len(parts) >= 2 and parts[0] == "bridge":
-                                    if parts[1] == "on" and len(parts) >= 3:
+                                        message_time = time.monotonic() + 2
+                                elif verb == "bridge" and action:
+                                    if action == "on" and arg:
                                         try:
-                                            port = int(parts[2])
+                                            port = int(arg)
                                             result = await self.start_load_balancer(port)
                                             if "✓" in result:
                                                 last_message = f"[green]{result}[/]"
                                             else:
                                                 last_message = f"[red]{result}[/]"
-                                            message_time = asyncio.get_running_loop().time() + 3
+                                            message_time = time.monotonic() + 3
                                         except ValueError:
                                             last_message = "[red]✗ Invalid port (must be a number)[/]"
-                                            message_time = asyncio.get_running_loop().time() + 2
-                                    elif parts[1] == "off":
+                                            message_time = time.monotonic() + 2
+                                    elif action == "off":
                                         result = await self.stop_load_balancer()
                                         if "✓" in result:
                                             last_message = f"[green]{result}[/]"
                                         else:
                                             last_message = f"[yellow]{result}[/]"
-                                        message_time = asyncio.get_running_loop().time() + 3
-                                    elif parts[1] == "stats":
+                                        message_time = time.monotonic() + 3
+                                    elif action == "stats":
                                         stats = self.get_load_balancer_stats()
                                         if stats:
                                             stats_text = (
@@ -363,188 +376,271 @@ class ChainsMixin:
                                             last_message = stats_text
                                         else:
                                             last_message = "[yellow]Load balancer is not running[/]"
-                                        message_time = asyncio.get_running_loop().time() + 5
+                                        message_time = time.monotonic() + 5
                                     else:
                                         last_message = "[yellow]? Usage: bridge [on <port>|off|stats][/]"
-                                        message_time = asyncio.get_running_loop().time() + 2
+                                        message_time = time.monotonic() + 2
                                 else:
                                     last_message = "[yellow]?[/] Unknown command. Type 'help' for available commands."
-                                    message_time = asyncio.get_running_loop().time() + 2
+                                    message_time = time.monotonic() + 2
                             except (ValueError, IndexError) as e:
                                 last_message = f"[red]✗[/] Error: {e}"
-                                message_time = asyncio.get_running_loop().time() + 2
+                                message_time = time.monotonic() + 2
                     elif char in ('\x7f', '\b'):  # Backspace
-                        input_buffer = input_buffer[:-1]
+                        if input_buffer:
+                            input_buffer.pop()
                     elif char == '\x03':  # Ctrl+C
                         exit_flag = True
-                    elif char.isprintable():
-                        input_buffer += char
-
-            def render_output() -> str:
-                """Renders the last output messages in a compact format."""
-                if not tail_buffer:
-                    return "[dim italic]Aguardando saída do processo...[/]"
-                
-                lines = []
-                for stream_label, text in tail_buffer:
-                    if stream_label == "STDOUT":
-                        icon = "[feedback.success]▶[/]"
-                    else:
-                        icon = "[feedback.error]⚠[/]"
-                    # Truncate very long lines
-                    if len(text) > 100:
-                        truncated = text[:100] + "..."
-                    else:
-                        truncated = text
-                    lines.append(f"{icon} [text.secondary]{truncated}[/]")
-                return "\n".join(lines)
-
-            def get_input_display() -> str:
-                """Creates the input line."""
-                current_time = asyncio.get_running_loop().time()
-                
-                if last_message and current_time < message_time:
-                    return last_message
-                
-                cursor = "[input.cursor]▊[/]" if int(current_time * 2) % 2 == 0 else " "
-                
-                if not input_buffer:
-                    # Show placeholder when input is empty
-                    return f"[input.prompt]❯[/] [text.secondary]Write help[/] {cursor}"
-                
-                return f"[input.prompt]❯[/] {input_buffer}{cursor}"
-
-            def get_header() -> str:
-                """Creates a beautiful header."""
-                proxy_count = len(self._bridges)
-                return f"[primary]╭─[/] [text.primary]Proxychains[/] [primary]─[/] [highlight]{proxy_count}[/] proxies [primary]─[/] [text.secondary]ESC para sair[/]"
-            
-            def get_status_panel():
-                """Creates the panel for status messages."""
-                if not status_buffer:
-                    return Panel(
-                        "[text.secondary]Ready[/]",
-                        title="[primary]│[/] [text.primary]Status[/]",
-                        title_align="left",
-                        border_style="border.bright",
-                        padding=(0, 1),
-                        height=7
-                    )
-                
-                messages_text = "\n".join(list(status_buffer))
-                return Panel(
-                    messages_text,
-                    title="[primary]│[/] [text.primary]Status[/]",
-                    title_align="left",
-                    border_style="border.bright",
-                    padding=(0, 1),
-                    height=7
+                    elif char in _PRINTABLE_ASCII or char.isprintable():
+                        input_buffer.append(char)
+                finally:
+                    redraw.set()
+
+        def render_output() -> str:
+            """Renders the last output messages, rebuilding only after new output."""
+            nonlocal output_dirty, output_markup
+            if output_dirty:
+                # Cleared first: a line landing mid-rebuild marks it dirty again.
+                output_dirty = False
+                if tail_index < tail_size:
+                    # Ring not wrapped yet: the filled slots are already in order
+                    lines = tail_buffer[:tail_index]
+                else:
+                    start = tail_index % tail_size
+                    lines = tail_buffer[start:] + tail_buffer[:start]
+                output_markup = (
+                    "\n".join(lines) or "[dim italic]Aguardando saída do processo...[/]"
                 )
+            return output_markup
+
+        def get_input_display() -> str:
+            """Creates the input line."""
+            # message_time deadlines are set with time.monotonic() as well.
+            current_time = time.monotonic()
+
+            if last_message and current_time < message_time:
+                return last_message
+
+            # Bit 29 of the nanosecond clock flips every ~537 ms.
+            cursor = " " if (time.monotonic_ns() >> 29) & 1 else "[input.cursor]▊[/]"
+
+            if not input_buffer:
+                # Show placeholder when input is empty
+                return f"[input.prompt]❯[/] [text.secondary]Write help[/] {cursor}"
+
+            return f"[input.prompt]❯[/] {''.join(input_buffer)}{cursor}"
 
+        header_count = -1
+        header_text = None
+
+        def get_header():
+            """Creates a beautiful header, parsed again only when the bridge count changes."""
+            nonlocal header_count, header_text
+            proxy_count = len(self._bridges)
+            if proxy_count != header_count:
+                header_text = Text.from_markup(
+                    f"[primary]╭─[/] [text.primary]Proxychains[/] [primary]─[/] [highlight]{proxy_count}[/] proxies [primary]─[/] [text.secondary]ESC para sair[/]"
+                )
+                header_count = proxy_count
+            return header_text
+
+        def get_status_text() -> str:
+            """Creates the body of the status panel."""
+            if not status_buffer:
+                return "[text.secondary]Ready[/]"
+            return "\n".join(status_buffer)
+
+        def add_output_line(label: str, text: str) -> None:
+            nonlocal output_dirty, tail_index
+            text = text.rstrip()
+            # Truncate very long lines
+            if len(text) > 100:
+                text = text[:100] + "..."
+            tail_buffer[tail_index % tail_size] = f"{_OUTPUT_LINE_PREFIXES[label]}{text}[/]"
+            tail_index += 1
+            output_dirty = True
+            redraw.set()
+
+        loop = asyncio.get_running_loop()
+
+        # Plain pipes drained by one reader callback per fd, instead of two
+        # StreamReader tasks each running their own await cycle.
+        stdout_read, stdout_write = os.pipe()
+        stderr_read, stderr_write = os.pipe()
+        try:
             process = await asyncio.create_subprocess_exec(
-                *full_command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                *full_command, stdout=stdout_write, stderr=stderr_write
             )
+        except BaseException:
+            os.close(stdout_read)
+            os.close(stderr_read)
+            raise
+        finally:
+            os.close(stdout_write)
+            os.close(stderr_write)
+
+        # fd -> (label, reusable buffer holding the unfinished last line)
+        open_streams = {
+            stdout_read: ("STDOUT", bytearray()),
+            stderr_read: ("STDERR", bytearray()),
+        }
+        streams_closed = loop.create_future()
+
+        def drain(fd: int) -> None:
+            label, buffer = open_streams[fd]
+            try:
+                data = os.read(fd, 65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                data = b""
+
+            if not data:
+                loop.remove_reader(fd)
+                if buffer:
+                    add_output_line(label, buffer.decode("utf-8", "replace"))
+                del open_streams[fd]
+                if not open_streams and not streams_closed.done():
+                    streams_closed.set_result(None)
+                return
+
+            # Split complete lines out of the buffer and drop them with a single
+            # del; a newline byte never occurs inside a multi-byte UTF-8 sequence.
+            buffer += data
+            end = buffer.rfind(b"\n")
+            if end == -1:
+                return
+            # Only the last tail_size lines of a chunk can still be on screen, so
+            # earlier ones are dropped without being decoded or formatted.
+            start = end
+            for _ in range(tail_size):
+                start = buffer.rfind(b"\n", 0, start)
+                if start == -1:
+                    break
+            for line in buffer[start + 1:end].split(b"\n"):
+                add_output_line(label, line.decode("utf-8", "replace"))
+            del buffer[:end + 1]
+
+        old_settings = None
+        stdin_transport = None
+        try:
+            for stream_fd in open_streams:
+                os.set_blocking(stream_fd, False)
+                self._enlarge_pipe_buffer(stream_fd)
+                loop.add_reader(stream_fd, drain, stream_fd)
 
-            async def read_stream(stream, label):
-                while True:
-                    line = await stream.readline()
-                    if not line:
-                        break
-                    tail_buffer.append((label, line.decode().rstrip()))
-
-            loop = asyncio.get_running_loop()
-            
             # Setup terminal for raw input
-            old_settings = None
             if _UNIX:
                 fd = sys.stdin.fileno()
                 old_settings = termios.tcgetattr(fd)
                 tty.setcbreak(fd)
-                loop.add_reader(fd, _handle_stdin)
-            
-            from rich.console import Group
-            from rich.text import Text
-            
-            try:
-                with Live(
-                    "", 
-                    console=self.console, 
-                    refresh_per_second=15,
-                    transient=False
-                ) as live:
-                    input_task = asyncio.create_task(_process_input_queue())
-                    stdout_task = asyncio.create_task(read_stream(process.stdout, "STDOUT"))
-                    stderr_task = asyncio.create_task(read_stream(process.stderr, "STDERR"))
-
-                    while not exit_flag and (not stdout_task.done() or not stderr_task.done()):
-                        # Create beautiful compact display
-                        header = Text.from_markup(get_header())
-                        
-                        # Calculate scroll limits
-                        view_height = 3
-                        total_proxies = len(self._bridges)
-                        max_scroll = max(0, total_proxies - view_height)
-                        scroll_offset = min(scroll_offset, max_scroll)
-                        
-                        # Add proxies table (compact version for chains)
-                        proxies_panel = self._display_active_bridges_summary(self.country_filter, scroll_offset, view_height)
-                        
-                        output_panel = Panel(
-                            render_output(),
-                            title="[primary]│[/] [text.primary]Saída[/]",
-                            title_align="left",
-                            border_style="border",
-                            padding=(0, 1),
-                            height=7,
-                        )
-                        
-                        status_panel = get_status_panel()
-                        
-                        input_panel = Panel(
-                            get_input_display(),
-                            title="[primary]│[/] [text.primary]Command[/]",
-                            title_align="left",
-                            border_style="border.bright",
-                            padding=(0, 1),
-                        )
-                        
-                        display = Group(header, proxies_panel, output_panel, status_panel, input_panel)
-                        live.update(display)
-                        await asyncio.sleep(0.066)  # ~15 FPS
-
-                    # Cancel input task and wait for stream tasks
-                    input_task.cancel()
-                    
-                    # Wait for stream tasks to complete
-                    try:
-                        await asyncio.gather(stdout_task, stderr_task, return_exceptions=True)
-                    except Exception:
-                        pass
-                    
-                    # Try to cancel input task if still running
+                # Read the terminal through its own descriptor: the pipe transport makes
+                # it non-blocking and closes it, which must not leak to the shared stdin.
+                tty_file = open(os.ttyname(fd), "rb", buffering=0)
+                try:
+                    reader = asyncio.StreamReader()
+                    stdin_transport, _ = await loop.connect_read_pipe(
+                        lambda: asyncio.StreamReaderProtocol(reader),
+                        tty_file,
+                    )
+                except BaseException:
+                    tty_file.close()
+                    raise
+                stdin_reader = reader
+
+            # Build the dashboard once; build_display only swaps the sections that
+            # change and is called whenever the dashboard is refreshed.
+            view_height = 3
+            output_panel = Panel(
+                render_output(),
+                title="[primary]│[/] [text.primary]Saída[/]",
+                title_align="left",
+                border_style="border",
+                padding=(0, 1),
+                height=7,
+            )
+            status_panel = Panel(
+                get_status_text(),
+                title="[primary]│[/] [text.primary]Status[/]",
+                title_align="left",
+                border_style="border.bright",
+                padding=(0, 1),
+                height=7,
+            )
+            input_panel = Panel(
+                get_input_display(),
+                title="[primary]│[/] [text.primary]Command[/]",
+                title_align="left",
+                border_style="border.bright",
+                padding=(0, 1),
+            )
+            display = Group(get_header(), "", output_panel, status_panel, input_panel)
+            sections = display.renderables
+
+            def build_display() -> Group:
+                """Refreshes the changing sections before each redraw."""
+                nonlocal scroll_offset
+                # Create beautiful compact display
+                sections[0] = get_header()
+
+                # Calculate scroll limits
+                total_proxies = len(self._bridges)
+                max_scroll = max(0, total_proxies - view_height)
+                scroll_offset = min(scroll_offset, max_scroll)
+
+                # Add proxies table (compact version for chains)
+                sections[1] = self._display_active_bridges_summary(self.country_filter, scroll_offset, view_height)
+
+                output_panel.renderable = render_output()
+                status_panel.renderable = get_status_text()
+                input_panel.renderable = get_input_display()
+                return display
+
+            async def redraw_on_change(live: Live) -> None:
+                """Redraws only when state changed, or for the cursor blink."""
+                while True:
                     try:
-                        await input_task
-                    except asyncio.CancelledError:
-                        pass
-                    except Exception:
-                        pass
-            finally:
-                # Restore terminal
-                if _UNIX and old_settings:
-                    loop.remove_reader(fd)
-                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-
-            return_code = await process.wait()
-            return return_code
-
+                        await asyncio.wait_for(redraw.wait(), timeout=0.5)
+                    except asyncio.TimeoutError:
+                        pass  # Blink tick; also expires timed messages
+                    redraw.clear()
+                    live.refresh()
+                    # Coalesce bursts of output into at most ~15 redraws per second
+                    await asyncio.sleep(1 / 15)
+
+            with Live(
+                console=self.console,
+                get_renderable=build_display,
+                auto_refresh=False,
+                transient=False
+            ) as live:
+                input_task = asyncio.create_task(_process_input())
+                exit_task = asyncio.create_task(process.wait())
+                redraw_task = asyncio.create_task(redraw_on_change(live))
+
+                # Wait for the output to drain and the process to exit together
+                await asyncio.wait({streams_closed, exit_task})
+                redraw_task.cancel()
+                if stdin_reader is not None:
+                    # Stop reading first: the reader rejects data after EOF.
+                    stdin_transport.pause_reading()
+                    stdin_reader.feed_eof()
+
+                # Let the input task finish whatever command it is running
+                try:
+                    await input_task
+                except Exception:
+                    pass
         finally:
-            self._interactive_ui = None  # Clear reference
-            if self.console:
-                self.console.print(
-                    "\n[warning]Terminating bridges and cleaning up...[/]"
-                )
-            await self.stop()
-            if tmpdir_path:
-                shutil.rmtree(tmpdir_path, ignore_errors=True)
\ No newline at end of file
+            for stream_fd in open_streams:
+                loop.remove_reader(stream_fd)
+            os.close(stdout_read)
+            os.close(stderr_read)
+
+            # Restore terminal
+            if stdin_transport is not None:
+                stdin_transport.close()
+            if _UNIX and old_settings:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+        return exit_task.result()
@@ -610,8 +610,7 @@ class TestingMixin:
         for entry in entries:
             destination = cls._format_destination(entry.host, entry.port)
             ping_str = f"{entry.ping:.1f} ms" if entry.ping is not None else "-"
-            country = (entry.exit_geo.label if entry.exit_geo else None) or \
-                      (entry.server_geo.label if entry.server_geo else None) or "-"
+            country = entry.country_label
 
             table.add_row(entry.tag or "-", destination, country, ping_str)
         return table
@@ -631,6 +630,11 @@ class _TestProgressDisplay:
         self.console = console
         self.total = max(total, 1)
         self.status_styles = status_styles
+        # Status markup is rebuilt on every update; the statuses are a closed set,
+        # so format each one once up front.
+        self._status_markup: Dict[str, str] = {
+            status: f"[{style}]{status}[/{style}]" for status, style in status_styles.items()
+        }
         self._records: Deque[Tuple[TestResult, bool]] = deque(maxlen=6)
         self._last_count = 0
         self._last_total = self.total
@@ -723,16 +727,14 @@ class _TestProgressDisplay:
             table.add_row("-", "-", "-", "-", "-")
         else:
             for entry, cached in self._records:
-                status_style = self.status_styles.get(entry.status, "info")
-                status_text = f"[{status_style}]{entry.status}[/{status_style}]"
+                status_text = self._format_status(entry.status)
                 if cached:
                     status_text += " [muted](cache)[/]"
 
                 proxy_label = self._compose_proxy_label(entry)
                 exit_ip = entry.exit_geo.ip if entry.exit_geo and entry.exit_geo.ip else entry.host
                 ping_label = f"{entry.ping:.1f} ms" if entry.ping is not None else "-"
-                country = (entry.exit_geo.label if entry.exit_geo else None) or \
-                          (entry.server_geo.label if entry.server_geo else None) or "-"
+                country = entry.country_label
 
                 table.add_row(
                     status_text,
@@ -761,8 +763,7 @@ class _TestProgressDisplay:
 
     def _format_description(self, entry: TestResult, cached: bool) -> str:
         """Creates the text shown alongside the progress bar."""
-        status_style = self.status_styles.get(entry.status, "info")
-        status_text = f"[{status_style}]{entry.status}[/{status_style}]"
+        status_text = self._format_status(entry.status)
         identifier = (
             entry.tag
             or (entry.protocol.upper() if entry.protocol else None)
@@ -773,6 +774,13 @@ class _TestProgressDisplay:
         source = "[text.secondary]cache[/]" if cached else "[success]live[/]"
         return f"{status_text} - {identifier} - {source}"
 
+    def _format_status(self, status: str) -> str:
+        """Returns the styled markup for a status, using the precomputed table."""
+        markup = self._status_markup.get(status)
+        if markup is None:
+            markup = f"[info]{status}[/info]"
+        return markup
+
     @staticmethod
     def _trim(value: Optional[str], max_length: int) -> str:
         """Shortens text to the supplied maximum length with an ellipsis."""
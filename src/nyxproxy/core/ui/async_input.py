@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import asyncio
 import queue
 import sys
@@ -13,6 +15,50 @@ except ImportError:
     import tty
     _WINDOWS = False
 
+
+def split_key_sequences(text: str) -> list[str]:
+    """Splits a chunk of terminal input into keys, keeping escape sequences whole.
+
+    Terminals deliver an escape sequence in a single write, so it can be split
+    out of the chunk without waiting for further bytes; a lone ESC stays '\\x1b'.
+    Anything after the sequence is returned as ordinary keys.
+    """
+    head, *sequences = text.split('\x1b')
+    keys = list(head)
+    for sequence in sequences:
+        if sequence[:1] == '[':
+            # CSI: parameters until the first final byte (0x40-0x7E).
+            end = len(sequence)
+            for index in range(1, len(sequence)):
+                if '@' <= sequence[index] <= '~':
+                    end = index + 1
+                    break
+        elif sequence[:1] == 'O':
+            end = 2  # SS3: 'O' plus one final byte (e.g. application-mode arrows)
+        else:
+            end = 1  # Alt+key: only the character right after ESC
+        keys.append('\x1b' + sequence[:end])
+        keys.extend(sequence[end:])
+    return keys
+
+
+def split_incomplete_sequence(text: str) -> tuple[str, str]:
+    """Separates an escape sequence cut off at the end of a read.
+
+    Returns (complete, pending): pending is a trailing lone ESC, 'ESC O' or an
+    unterminated CSI, whose remaining bytes may still arrive in the next read.
+    """
+    start = text.rfind('\x1b')
+    if start == -1:
+        return text, ''
+    tail = text[start + 1:]
+    if tail in ('', 'O') or (
+        tail[:1] == '[' and not any('@' <= char <= '~' for char in tail[1:])
+    ):
+        return text[:start], text[start:]
+    return text, ''
+
+
 class AsyncInput:
     """
     A class to read keyboard input asynchronously without blocking,
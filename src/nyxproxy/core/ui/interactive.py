@@ -1,12 +1,15 @@
 import asyncio
+import codecs
 import os
 import sys
+import time
 from collections import deque
+from typing import List
 
-from rich.layout import Layout
-from rich.live import Live
 from rich.panel import Panel
 
+from .async_input import split_incomplete_sequence, split_key_sequences
+
 # Cross-platform terminal raw mode handling
 try:
     import msvcrt
@@ -16,46 +19,53 @@ except ImportError:
     import tty
     _WINDOWS = False
 
+# Typed characters are almost always ASCII; a set lookup skips the Unicode
+# database, which isprintable() still covers for everything else.
+_PRINTABLE_ASCII = frozenset(map(chr, range(0x20, 0x7F)))
+
+
 class InteractiveUI:
     """Manages an interactive UI using Rich.Live and asyncio's event loop for input."""
+
+    # How long a sequence cut off at the end of a read waits for the rest,
+    # after which it is taken as typed (a lone ESC then closes the UI).
+    _ESCAPE_TIMEOUT = 0.05
+
     def __init__(self, manager):
         self.manager = manager
         self.console = manager.console
-        self.input_buffer = ""
+        self.input_buffer: List[str] = []  # Typed characters; backspace pops in O(1)
         self.exit_flag = False
         self.scroll_offset = 0
         self.last_message = ""
         self.message_display_time = 0
-        self.input_queue = asyncio.Queue()
+        # Typed keys (escape sequences kept whole), filled by the stdin reader
+        # callback on the same loop; input_ready wakes the consumer.
+        self.input_queue = deque()
+        self.input_ready = asyncio.Event()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self._pending_escape = ""  # Escape sequence split across reads
+        self._escape_timer = None
         self.status_messages = deque(maxlen=5)  # Keep last 5 status messages
+        # (key, renderable) of the last main panel; rebuilt only when the key changes.
+        self._summary_cache = (None, None)
+        # Set whenever typed input, a command or a status message changes the
+        # screen; the render loop sleeps on it instead of polling.
+        self._redraw = asyncio.Event()
+        self._redraw.set()
     
     def add_status_message(self, message: str):
         """Adds a status message to the buffer."""
         self.status_messages.append(message)
+        self._redraw.set()
 
-    def _get_status_panel(self):
-        """Creates the panel for status messages."""
+    def _get_status_text(self) -> str:
+        """Returns the content of the status panel."""
         if not self.status_messages:
-            return Panel(
-                "[text.secondary]Ready[/]",
-                title="[primary]│[/] [text.primary]Status[/]",
-                title_align="left",
-                border_style="border.bright",
-                padding=(0, 1),
-                height=7
-            )
-        
+            return "[text.secondary]Ready[/]"
         # Show last messages, most recent at bottom
-        messages_text = "\n".join(list(self.status_messages))
-        return Panel(
-            messages_text,
-            title="[primary]│[/] [text.primary]Status[/]",
-            title_align="left",
-            border_style="border.bright",
-            padding=(0, 1),
-            height=7
-        )
-    
+        return "\n".join(self.status_messages)
+
     def _get_input_panel(self) -> str:
         """Creates the panel for user input."""
         current_time = asyncio.get_running_loop().time()
@@ -63,25 +73,30 @@ class InteractiveUI:
         if self.last_message and current_time < self.message_display_time:
             return self.last_message
         
-        cursor = "[input.cursor]▊[/]" if int(current_time * 2) % 2 == 0 else " "
+        # Bit 29 of the nanosecond clock flips every ~537 ms.
+        cursor = " " if (time.monotonic_ns() >> 29) & 1 else "[input.cursor]▊[/]"
         
         if not self.input_buffer:
             # Show placeholder when input is empty
             return f"[input.prompt]❯[/] [text.secondary]Write help[/] {cursor}"
         
-        return f"[input.prompt]❯[/] {self.input_buffer}{cursor}"
+        return f"[input.prompt]❯[/] {''.join(self.input_buffer)}{cursor}"
 
     async def _process_command(self):
         """Processes the command entered by the user."""
-        command = self.input_buffer.strip().lower()
-        self.input_buffer = ""
+        command = "".join(self.input_buffer).strip().lower()
+        self.input_buffer.clear()
+        self._redraw.set()
 
         if not command:
             return
 
-        parts = command.split()
+        # The grammar is "<verb> <action> <arg>", with arg running to the end.
+        verb, _, rest = command.partition(" ")
+        action, _, arg = rest.lstrip().partition(" ")
+        arg = arg.strip()
         try:
-            if parts[0] == "help":
+            if verb == "help":
                 # Show available commands
                 help_text = (
                     "[primary]Available commands:[/]\n"
@@ -98,17 +113,17 @@ class InteractiveUI:
                 )
                 self.last_message = help_text
                 self.message_display_time = asyncio.get_running_loop().time() + 8
-            elif len(parts) >= 2 and parts[0] == "source":
-                if parts[1] == "list":
+            elif verb == "source" and action:
+                if action == "list":
                     self.last_message = self.manager.list_sources()
                     self.message_display_time = asyncio.get_running_loop().time() + 5
-                elif parts[1] == "add" and len(parts) >= 3:
-                    source_url = " ".join(parts[2:])  # Join in case URL has spaces
+                elif action == "add" and arg:
+                    source_url = arg
                     self.last_message = f"[feedback.success]{self.manager.add_source(source_url)}[/]"
                     self.message_display_time = asyncio.get_running_loop().time() + 3
-                elif parts[1] == "rem" and len(parts) >= 3:
+                elif action == "rem" and arg:
                     try:
-                        source_id = int(parts[2])
+                        source_id = int(arg)
                         result = self.manager.remove_source(source_id)
                         if "✓" in result:
                             self.last_message = f"[feedback.success]{result}[/]"
@@ -121,21 +136,20 @@ class InteractiveUI:
                 else:
                     self.last_message = "[warning]? Usage: source [list|add <url>|rem <id>][/]"
                     self.message_display_time = asyncio.get_running_loop().time() + 2
-            elif len(parts) >= 2 and parts[0] == "proxy":
-                if parts[1] == "rotate" and len(parts) >= 3:
-                    target = parts[2]
+            elif verb == "proxy" and action:
+                if action == "rotate" and arg:
+                    target = arg
                     if target == "all":
-                        tasks = [self.manager.rotate_proxy(i) for i in range(len(self.manager._bridges))]
-                        await asyncio.gather(*tasks)
+                        await self.manager.rotate_all_proxies()
                         self.last_message = "[feedback.success]✓[/] Rotated all proxies"
                     else:
                         bridge_id = int(target)
                         await self.manager.rotate_proxy(bridge_id)
                         self.last_message = f"[feedback.success]✓[/] Rotated proxy {bridge_id}"
                     self.message_display_time = asyncio.get_running_loop().time() + 2
-                elif parts[1] == "amount" and len(parts) >= 3:
+                elif action == "amount" and arg:
                     try:
-                        target_amount = int(parts[2])
+                        target_amount = int(arg)
                         result = await self.manager.adjust_bridge_amount(target_amount)
                         if "✓" in result:
                             self.last_message = f"[feedback.success]{result}[/]"
@@ -150,10 +164,10 @@ class InteractiveUI:
                 else:
                     self.last_message = "[warning]? Usage: proxy [rotate <id|all>|amount <number>][/]"
                     self.message_display_time = asyncio.get_running_loop().time() + 2
-            elif len(parts) >= 2 and parts[0] == "bridge":
-                if parts[1] == "on" and len(parts) >= 3:
+            elif verb == "bridge" and action:
+                if action == "on" and arg:
                     try:
-                        port = int(parts[2])
+                        port = int(arg)
                         result = await self.manager.start_load_balancer(port)
                         if "✓" in result:
                             self.last_message = f"[feedback.success]{result}[/]"
@@ -163,14 +177,14 @@ class InteractiveUI:
                     except ValueError:
                         self.last_message = "[feedback.error]✗ Invalid port (must be a number)[/]"
                         self.message_display_time = asyncio.get_running_loop().time() + 2
-                elif parts[1] == "off":
+                elif action == "off":
                     result = await self.manager.stop_load_balancer()
                     if "✓" in result:
                         self.last_message = f"[feedback.success]{result}[/]"
                     else:
                         self.last_message = f"[warning]{result}[/]"
                     self.message_display_time = asyncio.get_running_loop().time() + 3
-                elif parts[1] == "stats":
+                elif action == "stats":
                     stats = self.manager.get_load_balancer_stats()
                     if stats:
                         stats_text = (
@@ -196,68 +210,81 @@ class InteractiveUI:
         except Exception as e:
             self.last_message = f"[feedback.error]✗[/] Error: {e}"
             self.message_display_time = asyncio.get_running_loop().time() + 3
-            
+        self._redraw.set()
+
     def _handle_stdin(self):
         """Callback for asyncio's reader, reads from stdin and puts to queue."""
         # Read up to 1024 bytes to get whole escape sequences at once.
         # This is non-blocking because add_reader only calls it when data is ready.
         try:
             data = os.read(sys.stdin.fileno(), 1024)
-            for char in data.decode(errors='ignore'):
-                self.input_queue.put_nowait(char)
         except (BlockingIOError, InterruptedError):
-            pass  # Should not happen with add_reader, but good practice.
+            return  # Should not happen with add_reader, but good practice.
+        if self._escape_timer is not None:
+            self._escape_timer.cancel()
+            self._escape_timer = None
+        text, self._pending_escape = split_incomplete_sequence(
+            self._pending_escape + self._decoder.decode(data)
+        )
+        if self._pending_escape:
+            self._escape_timer = asyncio.get_running_loop().call_later(
+                self._ESCAPE_TIMEOUT, self._flush_pending_escape
+            )
+        if text:
+            self.input_queue.extend(split_key_sequences(text))
+            self.input_ready.set()
 
-    async def _process_input_queue(self):
-        """Processes characters and sequences from the input queue."""
-        char_buffer = deque()
+    def _flush_pending_escape(self):
+        """Queues a cut-off sequence whose remaining bytes never arrived."""
+        self._escape_timer = None
+        self.input_queue.extend(split_key_sequences(self._pending_escape))
+        self._pending_escape = ""
+        self.input_ready.set()
 
+    async def _poll_windows_keys(self):
+        """Feeds the input queue from the console on Windows, which has no add_reader."""
         while not self.exit_flag:
-            if not char_buffer:
-                # Wait for the first character
-                char = await self.input_queue.get()
-            else:
-                # Use what's left in the buffer
-                char = char_buffer.popleft()
+            if msvcrt.kbhit():
+                while msvcrt.kbhit():
+                    char = msvcrt.getwch()
+                    if char in ('\x00', '\xe0'):
+                        # Special keys (e.g. arrows) arrive as a prefix plus a code.
+                        char += msvcrt.getwch()
+                    self.input_queue.append(char)
+                self.input_ready.set()
+            await asyncio.sleep(0.01)
+
+    async def _process_input_queue(self):
+        """Processes keys and escape sequences from the input queue."""
+        while not self.exit_flag:
+            if not self.input_queue:
+                self.input_ready.clear()
+                await self.input_ready.wait()
 
-            # Handle escape sequences
-            if char == '\x1b':
-                sequence = char
-                # Greedily read subsequent chars if they arrive quickly
-                try:
-                    while True:
-                        sequence += await asyncio.wait_for(self.input_queue.get(), timeout=0.01)
-                except asyncio.TimeoutError:
-                    pass # End of sequence
-                
-                if sequence == '\x1b': # Lone ESC
+            # Drain everything read so far (a whole paste at once) before waiting again.
+            while self.input_queue and not self.exit_flag:
+                key = self.input_queue.popleft()
+
+                if key == '\x1b': # Lone ESC
                     self.exit_flag = True
-                elif sequence == '\x1b[A': # Up Arrow
+                elif key in ('\x1b[A', '\x1bOA', '\xe0H'): # Up Arrow
                     self.scroll_offset = max(0, self.scroll_offset - 1)
-                elif sequence == '\x1b[B': # Down Arrow
+                elif key in ('\x1b[B', '\x1bOB', '\xe0P'): # Down Arrow
                     self.scroll_offset += 1
-                # Add other sequences here if needed (e.g., \xe0H for Windows)
-
-            # Handle Windows arrow keys (2-byte sequences)
-            elif _WINDOWS and char == '\xe0':
-                try:
-                    next_char = await asyncio.wait_for(self.input_queue.get(), timeout=0.01)
-                    if next_char == 'H': # Up
-                        self.scroll_offset = max(0, self.scroll_offset - 1)
-                    elif next_char == 'P': # Down
-                        self.scroll_offset += 1
-                except asyncio.TimeoutError:
-                    pass
+                elif len(key) > 1:
+                    pass  # Other escape sequences and special keys are ignored
 
-            # Handle regular characters
-            elif char in ('\r', '\n'):
-                await self._process_command()
-            elif char in ('\x7f', '\b'): # Backspace
-                self.input_buffer = self.input_buffer[:-1]
-            elif char == '\x03': # Ctrl+C
-                self.exit_flag = True
-            elif char.isprintable():
-                self.input_buffer += char
+                # Handle regular characters
+                elif key in ('\r', '\n'):
+                    await self._process_command()
+                elif key in ('\x7f', '\b'): # Backspace
+                    if self.input_buffer:
+                        self.input_buffer.pop()
+                elif key == '\x03': # Ctrl+C
+                    self.exit_flag = True
+                elif key in _PRINTABLE_ASCII or key.isprintable():
+                    self.input_buffer.append(key)
+            self._redraw.set()
 
 
     async def run(self, main_renderable_callable):
@@ -266,8 +293,8 @@ class InteractiveUI:
         
         # Setup terminal for raw input
         if _WINDOWS:
-            # No special setup needed for Windows msvcrt
-            pass
+            # The console handle is not selectable; poll it from a task instead.
+            reader_task = asyncio.create_task(self._poll_windows_keys())
         else:
             fd = sys.stdin.fileno()
             old_settings = termios.tcgetattr(fd)
@@ -278,44 +305,97 @@ class InteractiveUI:
 
         try:
             from rich.console import Group
+            from rich.live import Live
             from rich.text import Text
             
+            # Build the display once; each redraw only swaps the panels' contents.
+            status_panel = Panel(
+                "",
+                title="[primary]│[/] [text.primary]Status[/]",
+                title_align="left",
+                border_style="border.bright",
+                padding=(0, 1),
+                height=7
+            )
+            input_panel = Panel(
+                "",
+                title="[primary]│[/] [text.primary]Command[/]",
+                title_align="left",
+                border_style="border.bright",
+                padding=(0, 1)
+            )
+            display = Group("", status_panel, input_panel)
+            sections = display.renderables
+
+            # Redraws are driven below, only when something on screen changed.
+            last_frame_state = None
             with Live(
                 "",
                 console=self.console,
                 transient=False,
-                refresh_per_second=15
+                auto_refresh=False
             ) as live:
                 while not self.exit_flag:
+                    # Besides _redraw, the screen changes when the bridges change, on
+                    # each cursor blink (~537 ms) and when a timed message expires.
+                    now = loop.time()
+                    message_shown = bool(self.last_message) and now < self.message_display_time
+                    frame_state = (
+                        self.manager._bridges_version,
+                        (time.monotonic_ns() >> 29) & 1,
+                        message_shown,
+                    )
+                    if not self._redraw.is_set() and frame_state == last_frame_state:
+                        # Sleep until woken, or until the next blink or message expiry.
+                        timeout = ((1 << 29) - (time.monotonic_ns() & ((1 << 29) - 1))) / 1e9
+                        if message_shown:
+                            timeout = min(timeout, self.message_display_time - now)
+                        try:
+                            await asyncio.wait_for(self._redraw.wait(), timeout=timeout)
+                        except asyncio.TimeoutError:
+                            pass
+                        continue
+                    self._redraw.clear()
+                    last_frame_state = frame_state
+
                     # Fixed height for proxy list
                     view_height = 10
-                    main_content = main_renderable_callable(self.scroll_offset, view_height)
+                    summary_key = (
+                        self.manager._bridges_version,
+                        self.manager.country_filter,
+                        self.scroll_offset,
+                        view_height,
+                    )
+                    if summary_key == self._summary_cache[0]:
+                        main_content = self._summary_cache[1]
+                    else:
+                        main_content = main_renderable_callable(self.scroll_offset, view_height)
+                        self._summary_cache = (summary_key, main_content)
                     
                     # Calculate scroll limits
                     if hasattr(main_content, 'renderable'):
                         total_rows = len(self.manager._bridges)
                         max_scroll = max(0, total_rows - view_height)
-                        self.scroll_offset = min(self.scroll_offset, max_scroll)
+                        if self.scroll_offset > max_scroll:
+                            # Drawn past the end; redraw at the clamped offset next tick.
+                            self.scroll_offset = max_scroll
+                            self._redraw.set()
 
-                    # Create beautiful compact display with fixed height
-                    status_panel = self._get_status_panel()
-                    
-                    input_panel = Panel(
-                        self._get_input_panel(),
-                        title="[primary]│[/] [text.primary]Command[/]",
-                        title_align="left",
-                        border_style="border.bright",
-                        padding=(0, 1)
-                    )
-                    
-                    display = Group(main_content, status_panel, input_panel)
-                    live.update(display)
-                    await asyncio.sleep(0.066)  # ~15 FPS
+                    sections[0] = main_content
+                    status_panel.renderable = self._get_status_text()
+                    input_panel.renderable = self._get_input_panel()
+                    live.update(display, refresh=True)
+                    # Coalesce bursts (e.g. a paste) into at most ~15 redraws per second
+                    await asyncio.sleep(0.066)
         finally:
             # Stop the input processing task
             input_task.cancel()
             
             # Clean up terminal state
-            if not _WINDOWS:
+            if _WINDOWS:
+                reader_task.cancel()
+            else:
                 loop.remove_reader(fd)
+                if self._escape_timer is not None:
+                    self._escape_timer.cancel()
                 termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
\ No newline at end of file
@@ -2,18 +2,27 @@ from __future__ import annotations
 
 """Utility functions shared among the manager's mixins."""
 
-import base64
+import binascii
 import os
 import re
 import shutil
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import aiofiles
 
+try:
+    # SIMD-accelerated drop-in for the stdlib module (optional "speed" extra).
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 from ..config.exceptions import XrayError
 from ..models.proxy import TestResult
 
+# Sources are read and parsed this many bytes at a time instead of whole.
+_SOURCE_CHUNK_SIZE = 1 << 16
+
 
 class ProxyUtilityMixin:
     """Auxiliary routines that do not depend on complex state."""
@@ -22,10 +31,15 @@ class ProxyUtilityMixin:
     def _b64decode_padded(value: str) -> bytes:
         """Decodes base64 (URL-safe) tolerating strings without padding."""
         value = value.strip().replace('-', '+').replace('_', '/')
-        missing_padding = len(value) % 4
-        if missing_padding:
-            value += "=" * (4 - missing_padding)
-        return base64.b64decode(value)
+        padding = -len(value) & 3
+        if padding:
+            value += "=" * padding
+        try:
+            # Strict mode decodes and validates in one pass.
+            return base64.b64decode(value, validate=True)
+        except binascii.Error:
+            # Stray characters (e.g. line breaks in subscriptions) are discarded.
+            return base64.b64decode(value)
 
     @staticmethod
     def _sanitize_tag(tag: Optional[str], fallback: str) -> str:
@@ -73,25 +87,50 @@ class ProxyUtilityMixin:
         except (TypeError, ValueError):
             return None
 
-    async def _read_source_text(self, source: str) -> str:
-            """Gets content from a local file or URL, with error handling."""
+    async def _iter_source_lines(self, source: str) -> AsyncIterator[List[str]]:
+            """Yields the lines of a local file or URL in batches, one read chunk at a time."""
             if re.match(r"^https?://", source, re.I):
                 if self.requests is None:
                     raise RuntimeError(
                         "'requests' package is required to download from URLs."
                     )
-                resp = await self.requests.get(
-                    source, timeout=30, headers={'User-Agent': self.user_agent}
-                )
-                resp.raise_for_status()
-                return self._decode_bytes(resp.content, encoding_hint=resp.encoding)
+                async with self.requests.stream(
+                    "GET", source, timeout=30, headers={'User-Agent': self.user_agent}
+                ) as resp:
+                    resp.raise_for_status()
+                    chunks = resp.aiter_bytes(_SOURCE_CHUNK_SIZE)
+                    async for lines in self._split_source_chunks(chunks, resp.encoding):
+                        yield lines
+                return
 
             path = Path(source)
             if not path.is_file():
                 raise FileNotFoundError(f"Source file not found: {source}")
             async with aiofiles.open(path, "rb") as f:
-                content = await f.read()
-            return self._decode_bytes(content)
+
+                async def read_chunks() -> AsyncIterator[bytes]:
+                    while chunk := await f.read(_SOURCE_CHUNK_SIZE):
+                        yield chunk
+
+                async for lines in self._split_source_chunks(read_chunks()):
+                    yield lines
+
+    @classmethod
+    async def _split_source_chunks(
+        cls, chunks: AsyncIterator[bytes], encoding_hint: Optional[str] = None
+    ) -> AsyncIterator[List[str]]:
+        """Decodes raw chunks into lists of complete lines, carrying partial lines over."""
+        pending: List[bytes] = []
+        async for chunk in chunks:
+            pending.append(chunk)
+            if b"\n" not in chunk:
+                continue  # Keep joining until a line ends, without re-copying the head
+            head, _, tail = b"".join(pending).rpartition(b"\n")
+            pending = [tail]
+            # '\n' never occurs inside a multi-byte character, so the head decodes alone.
+            yield cls._decode_bytes(head, encoding_hint=encoding_hint).splitlines()
+        if pending and (rest := b"".join(pending)):
+            yield cls._decode_bytes(rest, encoding_hint=encoding_hint).splitlines()
 
     @staticmethod
     def _shutil_which(cmd: str) -> Optional[str]:
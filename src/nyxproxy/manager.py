@@ -87,7 +87,11 @@ class Proxy(
         self.country_filter = country
         self.max_count = max_count
         self.use_cache = use_cache
-        self.requests = requests_session or httpx.AsyncClient()
+        # httpx keeps only 20 idle connections by default; keep as many as the default
+        # 50 test workers so geo lookups and source downloads reuse them.
+        self.requests = requests_session or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
         self.console = Console(theme=DEFAULT_RICH_THEME) if use_console else None
 
         self.test_url = DEFAULT_TEST_URL
@@ -95,7 +99,9 @@ class Proxy(
 
         self._outbounds: Dict[str, Proxy.Outbound] = {}
         self._entries: List[Proxy.TestResult] = []
+        self._entry_by_uri: Optional[Dict[str, Proxy.TestResult]] = None  # Lazy URI index
         self._bridges: List[Proxy.BridgeRuntime] = []
+        self._bridges_version = 0  # Bumped whenever _bridges changes; keys UI render caches
         self._parse_errors: List[str] = []
         self._running = False
         self._sources: List[str] = []  # Store proxy sources for reloading
@@ -104,7 +110,8 @@ class Proxy(
         self._port_allocation_lock = asyncio.Lock()
         self._allocated_ports: set[int] = set()
         self._cache_lock = asyncio.Lock()
-        self._rotation_lock = asyncio.Lock()  # Prevents race conditions during parallel rotations
+        self._rotation_lock = asyncio.Lock()  # Guards proxy selection during parallel rotations
+        self._rotation_reservations: Dict[int, str] = {}  # bridge_id -> URI being switched to
         self._stop_event = asyncio.Event()
         self._interactive_ui = None  # Reference to interactive UI when active
         self._initial_status_messages = deque(maxlen=10)  # Buffer for messages before UI is created
@@ -257,10 +264,11 @@ class Proxy(
             if unique_configs:
                 self._outbounds.clear()
                 self._entries.clear()
+                self._entry_by_uri = None
                 
                 uris_to_add = []
-                for config in unique_configs:
-                    uri = deduplicator.reconstruct_config_url(config)
+                uris = deduplicator.reconstruct_all(unique_configs)
+                for config, uri in zip(unique_configs, uris):
                     if uri:
                         uris_to_add.append(uri)
                     elif self.console: